@@ -3,24 +3,31 @@
 import asyncio
 import os
 from src.core.logging.logger import setup_production_logging, setup_dev_logging
-from src.core.config.container import setup_container
 
-# Načti mode z env (default: production)
-DEV_MODE = os.getenv("DEV_MODE", "false").lower() == "true"
 
-# Setup logging PŘED vším ostatním
-if DEV_MODE:
-    setup_dev_logging()
-else:
-    setup_production_logging()
+def setup_logging():
+    """Setup logging podle DEV_MODE z env (default: production)"""
+    dev_mode = os.getenv("DEV_MODE", "false").lower() == "true"
+
+    if dev_mode:
+        setup_dev_logging()
+    else:
+        setup_production_logging()
 
 async def main():
     """Application entry point"""
+    # Import až při spuštění - import main.py (testy, tooling) nenačítá celý stack
+    from src.core.config.container import setup_container
+
     container = setup_container()
+    # Modely a síťové kontroly se rozběhnou na pozadí, než UI sestaví orchestrátor
+    container.warmup()
     ui = container.console_ui()
     await ui.run()
 
 if __name__ == "__main__":
+    # Setup logging PŘED vším ostatním
+    setup_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
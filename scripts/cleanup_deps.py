@@ -4,11 +4,30 @@ Automaticky vyčistí virtualenv od nevyužitých balíčků.
 """
 
 import ast
+import asyncio
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from importlib import metadata
 import json
+import multiprocessing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_NAME_SEPARATORS = re.compile(r'[-_.]+')
+
+
+def _normalize_name(name):
+    """Normalizuje jméno balíčku (PEP 503): lowercase, '_' a '.' -> '-'."""
+    return _NAME_SEPARATORS.sub('-', name).lower()
+
 
 # Mapa: import_name -> pip_package_name (pro častá rozdílná jména)
 IMPORT_TO_PACKAGE = {
@@ -23,21 +42,74 @@ IMPORT_TO_PACKAGE = {
 }
 
 # Balíčky které NIKDY nesmažeme
-PROTECTED_PACKAGES = {
+PROTECTED_PACKAGES = frozenset(map(_normalize_name, {
     'pip', 'setuptools', 'wheel', 'pkg-resources'
-}
+}))
 
 # Dev tools - separovat do requirements-dev.txt
-DEV_TOOLS = {
+DEV_TOOLS = frozenset(map(_normalize_name, {
     'black', 'mypy', 'ruff', 'pytest', 'pytest-asyncio',
     'pytest-cov', 'coverage', 'flake8', 'pylint', 'isort'
-}
+}))
+
+
+# Adresáře do kterých při hledání importů vůbec nesestupujeme
+SKIP_DIRS = {'venv', '.venv', '__pycache__', '.git', 'node_modules'}
+
+# Cache naparsovaných importů: {cesta: [mtime, [importy]]}
+PARSE_CACHE_FILE = '.cleanup_deps_cache.json'
+
+# Od kolika souborů se vyplatí parsovat paralelně (start procesů není zdarma)
+PARALLEL_PARSE_MIN_FILES = 32
+
+# Kolik balíčků předat jednomu volání `pip uninstall`
+UNINSTALL_BATCH_SIZE = 50
+
+# Jméno distribuce na začátku requirement stringu ("urllib3<3,>=1.21 ; ...")
+_REQUIREMENT_NAME = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+
+class PipError(RuntimeError):
+    """pip skončil s nenulovým návratovým kódem."""
+
+
+def _extract_imports(filepath):
+    """
+    Naparsuje soubor a vrátí top-level jména importovaných modulů.
+    Top-level funkce, aby šla poslat do ProcessPoolExecutor.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=filepath, type_comments=False)
+
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                found.add(alias.name.split('.')[0])
+
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                found.add(node.module.split('.')[0])
+
+    return found
+
+
+def _extract_imports_safe(filepath):
+    """Jako _extract_imports, ale chybu vrátí místo vyhození."""
+    try:
+        return _extract_imports(filepath), None
+    except Exception as e:
+        return None, e
 
 
 class DependencyCleaner:
+    # Kompletní seznam modulů standardní knihovny (Python 3.10+)
+    _STDLIB: frozenset = frozenset(sys.stdlib_module_names)
+
     def __init__(self, project_paths=None):
         self.project_paths = project_paths or ['src', 'main.py']
         self.imports = set()
+        # Normalizované jméno (PEP 503) -> verze
         self.installed_packages = {}
 
     def log(self, message, emoji="ℹ️"):
@@ -47,54 +119,127 @@ class DependencyCleaner:
         """Najde všechny importy v projektu pomocí AST."""
         self.log("Hledám importy v projektu...", "🔍")
 
+        cache = self._load_parse_cache()
+        files = []
+
         for path_str in self.project_paths:
             path = Path(path_str)
 
             if path.is_file() and path.suffix == '.py':
-                self._parse_file(path)
+                files.append(str(path))
             elif path.is_dir():
-                for py_file in path.rglob('*.py'):
-                    # Přeskoč venv a __pycache__
-                    if 'venv' in str(py_file) or '__pycache__' in str(py_file):
-                        continue
-                    self._parse_file(py_file)
+                for root, dirs, names in os.walk(path):
+                    # Přeskoč venv a __pycache__ ještě před sestupem do nich
+                    dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+                    files.extend(os.path.join(root, n) for n in names if n.endswith('.py'))
+
+        # Nezměněné soubory vezmi z cache, zbytek naparsuj
+        to_parse = []
+        for filepath in files:
+            try:
+                mtime = os.path.getmtime(filepath)
+            except OSError as e:
+                self.log(f"⚠️  Chyba při parsování {filepath}: {e}", "⚠️")
+                continue
+
+            cached = cache.get(filepath)
+            if cached and cached[0] == mtime:
+                self.imports.update(cached[1])
+            else:
+                to_parse.append((filepath, mtime))
+
+        paths = [filepath for filepath, _ in to_parse]
+        if len(paths) >= PARALLEL_PARSE_MIN_FILES:
+            # ast.parse je CPU-bound - rozděl přes jádra mimo GIL.
+            # Spawn místo fork: find_all_imports běží ve worker vlákně vedle
+            # asyncio pip subprocesů a fork vícevláknového procesu může zamrznout
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+                results = list(executor.map(_extract_imports_safe, paths, chunksize=32))
+        else:
+            results = [_extract_imports_safe(filepath) for filepath in paths]
+
+        for (filepath, mtime), (found, error) in zip(to_parse, results):
+            if error is not None:
+                self.log(f"⚠️  Chyba při parsování {filepath}: {error}", "⚠️")
+                continue
+            self.imports |= found
+            cache[filepath] = [mtime, sorted(found)]
+
+        self._save_parse_cache(cache)
 
         self.log(f"Nalezeno {len(self.imports)} unikátních importů", "✅")
         return self.imports
 
-    def _parse_file(self, filepath):
-        """Parsuje Python soubor a extrahuje importy."""
+    def _load_parse_cache(self):
+        """Načte cache importů z minulého běhu (klíčovanou podle mtime)."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                tree = ast.parse(f.read(), filename=str(filepath))
+            with open(PARSE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        module = alias.name.split('.')[0]
-                        self.imports.add(module)
-
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        module = node.module.split('.')[0]
-                        self.imports.add(module)
+    def _save_parse_cache(self, cache):
+        """Uloží cache importů pro další běh."""
+        try:
+            with open(PARSE_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            self.log(f"Nepodařilo se uložit cache importů: {e}", "⚠️")
+
+    async def _run_pip(self, *args):
+        """
+        Spustí pip asynchronně a vrátí jeho stdout (bytes).
+
+        Raises:
+            PipError: pip skončil chybou (zpráva obsahuje jeho stderr)
+        """
+        # --disable-pip-version-check: pip jinak může kontaktovat PyPI
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, '-m', 'pip', *args, '--disable-pip-version-check',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            # Prázdný stdout by jinak tiše vypadal jako "žádné balíčky"
+            raise PipError(
+                f"pip {' '.join(args)} selhal (kód {process.returncode}): "
+                f"{stderr.decode(errors='replace').strip()}"
+            )
+        return stdout
+
+    async def _scan_project(self):
+        """
+        Najde importy a souběžně načte `pip list` a `pip freeze`.
+
+        Returns:
+            (imports, pip_list_output, pip_freeze_output)
+        """
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            loop.run_in_executor(None, self.find_all_imports),
+            self._run_pip('list', '--format', 'json'),
+            self._run_pip('freeze'),
+        )
 
-        except Exception as e:
-            self.log(f"⚠️  Chyba při parsování {filepath}: {e}", "⚠️")
+    def get_installed_packages(self, pip_list_output):
+        """
+        Získá seznam nainstalovaných pip balíčků.
 
-    def get_installed_packages(self):
-        """Získá seznam nainstalovaných pip balíčků."""
+        Args:
+            pip_list_output: Výstup `pip list --format json` (bytes) z _scan_project
+        """
         self.log("Získávám seznam nainstalovaných balíčků...", "📦")
 
-        result = subprocess.run(
-            [sys.executable, '-m', 'pip', 'list', '--format', 'json'],
-            capture_output=True,
-            text=True
-        )
+        # Parsujeme přímo bytes - orjson je rychlejší a ušetří dekódování
+        if orjson is not None:
+            packages = orjson.loads(pip_list_output)
+        else:
+            packages = json.loads(pip_list_output)
 
-        packages = json.loads(result.stdout)
+        # Jména normalizujeme jednou při načtení - dál se porovnává jen přímo
         self.installed_packages = {
-            pkg['name'].lower(): pkg['version']
+            _normalize_name(pkg['name']): pkg['version']
             for pkg in packages
         }
 
@@ -111,87 +256,111 @@ class DependencyCleaner:
                 continue
 
             # Použij mapu pro speciální případy
-            package_name = IMPORT_TO_PACKAGE.get(imp, imp)
-
-            # Normalizuj na lowercase
-            package_name = package_name.lower().replace('_', '-')
+            package_name = _normalize_name(IMPORT_TO_PACKAGE.get(imp, imp))
 
             # Zkontroluj že je nainstalovaný
             if package_name in self.installed_packages:
                 mapped_packages.add(package_name)
-            else:
-                # Zkus bez úprav
-                if imp.lower() in self.installed_packages:
-                    mapped_packages.add(imp.lower())
 
         return mapped_packages
 
     def _is_stdlib(self, module_name):
         """Zkontroluje jestli je modul součástí standardní knihovny."""
-        stdlib_modules = {
-            'abc', 'argparse', 'asyncio', 'base64', 'collections', 'concurrent',
-            'contextlib', 'copy', 'dataclasses', 'datetime', 'enum', 'functools',
-            'gzip', 'hashlib', 'http', 'importlib', 'io', 'itertools', 'json',
-            'logging', 'math', 'multiprocessing', 'os', 'pathlib', 'pickle',
-            'platform', 'queue', 're', 'shutil', 'socket', 'ssl', 'string',
-            'subprocess', 'sys', 'tempfile', 'threading', 'time', 'traceback',
-            'typing', 'unittest', 'urllib', 'uuid', 'warnings', 'weakref', 'xml',
-        }
-        return module_name in stdlib_modules
+        return module_name in self._STDLIB
 
     def identify_unused_packages(self, used_packages):
-        """Identifikuje nevyužité balíčky."""
+        """
+        Identifikuje nevyužité balíčky.
+
+        Tranzitivní závislosti použitých balíčků se ponechají - jinak by
+        např. `requests` přišel o `urllib3`.
+        """
+        keep = self._dependency_closure(used_packages)
         all_packages = set(self.installed_packages.keys())
-        unused = all_packages - used_packages - PROTECTED_PACKAGES
+        unused = all_packages - keep - PROTECTED_PACKAGES
 
         return unused
 
-    def create_backup(self):
-        """Vytvoří zálohu requirements.txt a pip freeze."""
+    def _dependency_closure(self, packages):
+        """Vrátí balíčky včetně všech (tranzitivních) nainstalovaných závislostí."""
+        keep = set(packages)
+        stack = list(packages)
+        while stack:
+            try:
+                requirements = metadata.requires(stack.pop()) or []
+            except metadata.PackageNotFoundError:
+                continue
+
+            # Markery (extras, platforma) ignorujeme - radši ponecháme víc
+            for requirement in requirements:
+                match = _REQUIREMENT_NAME.match(requirement)
+                if not match:
+                    continue
+                dep = _normalize_name(match.group(1))
+                if dep in self.installed_packages and dep not in keep:
+                    keep.add(dep)
+                    stack.append(dep)
+
+        return keep
+
+    def create_backup(self, freeze_output):
+        """
+        Vytvoří zálohu requirements.txt a pip freeze.
+
+        Args:
+            freeze_output: Výstup `pip freeze` (bytes) z _scan_project
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Zálohuj requirements.txt
+        backup_req = None
         if Path('requirements.txt').exists():
             backup_req = f'requirements.txt.backup_{timestamp}'
             Path('requirements.txt').rename(backup_req)
             self.log(f"Zálohován requirements.txt -> {backup_req}", "💾")
 
         # Vytvoř zálohu všech nainstalovaných balíčků
-        result = subprocess.run(
-            [sys.executable, '-m', 'pip', 'freeze'],
-            capture_output=True,
-            text=True
-        )
-
         backup_freeze = f'installed_packages_{timestamp}.txt'
-        with open(backup_freeze, 'w') as f:
-            f.write(result.stdout)
+        with open(backup_freeze, 'wb') as f:
+            f.write(freeze_output)
 
         self.log(f"Zálohován pip freeze -> {backup_freeze}", "💾")
 
         return backup_req, backup_freeze
 
     def uninstall_packages(self, packages_to_remove):
-        """Odinstaluje balíčky."""
+        """
+        Odinstaluje balíčky.
+
+        Returns:
+            Seznam balíčků z dávek, jejichž odinstalace selhala
+        """
         if not packages_to_remove:
             self.log("Žádné balíčky k odstranění!", "✅")
-            return
+            return []
 
         self.log(f"Odinstalovávám {len(packages_to_remove)} balíčků...", "🗑️")
 
-        # Odinstaluj v dávkách
-        packages_list = list(packages_to_remove)
-
-        result = subprocess.run(
-            [sys.executable, '-m', 'pip', 'uninstall', '-y'] + packages_list,
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
+        # Odinstaluj v dávkách - výstup pipu jde rovnou do terminálu
+        # a chyba v jedné dávce nezastaví ostatní
+        packages_list = sorted(packages_to_remove)
+        failed = []
+
+        for i in range(0, len(packages_list), UNINSTALL_BATCH_SIZE):
+            batch = packages_list[i:i + UNINSTALL_BATCH_SIZE]
+            result = subprocess.run(
+                [sys.executable, '-m', 'pip', 'uninstall', '-y', *batch],
+                check=False
+            )
+            if result.returncode != 0:
+                failed.extend(batch)
+
+        if not failed:
             self.log(f"Úspěšně odinstalováno {len(packages_to_remove)} balíčků!", "✅")
         else:
-            self.log(f"Chyba při odinstalaci: {result.stderr}", "❌")
+            self.log(f"Chyba při odinstalaci dávky: {', '.join(failed)}", "❌")
+
+        return failed
 
     def generate_requirements(self, used_packages):
         """Vygeneruje nový requirements.txt."""
@@ -255,15 +424,20 @@ class DependencyCleaner:
         print("🧹 AUTOMATICKÉ ČIŠTĚNÍ DEPENDENCIES")
         print("=" * 60 + "\n")
 
-        # 1. Najdi importy
-        imports = self.find_all_imports()
+        # 1. Najdi importy (pip list a pip freeze běží mezitím souběžně)
+        try:
+            imports, pip_list_output, freeze_output = asyncio.run(self._scan_project())
+        except PipError as e:
+            # Bez seznamu balíčků a zálohy nelze bezpečně nic odinstalovat
+            self.log(str(e), "❌")
+            sys.exit(1)
 
         print(f"\n📋 Nalezené importy:")
         for imp in sorted(imports):
             print(f"   - {imp}")
 
         # 2. Získej nainstalované balíčky
-        self.get_installed_packages()
+        self.get_installed_packages(pip_list_output)
 
         # 3. Mapuj importy na balíčky
         used_packages = self.map_imports_to_packages()
@@ -290,11 +464,11 @@ class DependencyCleaner:
                 self.log("Operace zrušena.", "❌")
                 return
 
-        # 7. Vytvoř zálohy
-        self.create_backup()
+        # 7. Vytvoř zálohy (freeze je ze stavu před odinstalací)
+        self.create_backup(freeze_output)
 
         # 8. Odinstaluj nevyužité balíčky
-        self.uninstall_packages(unused_packages)
+        failed = self.uninstall_packages(unused_packages)
 
         # 9. Vygeneruj nový requirements.txt
         self.generate_requirements(used_packages)
@@ -305,12 +479,19 @@ class DependencyCleaner:
             capture_output=True,
             text=True
         )
-        with open('requirements.lock', 'w') as f:
-            f.write(result.stdout)
-        self.log("Vytvořen requirements.lock", "✅")
+        if result.returncode == 0:
+            with open('requirements.lock', 'w') as f:
+                f.write(result.stdout)
+            self.log("Vytvořen requirements.lock", "✅")
+        else:
+            failed.append('requirements.lock')
+            self.log(f"pip freeze selhal, requirements.lock nevytvořen: {result.stderr.strip()}", "❌")
 
         print("\n" + "=" * 60)
-        print("✅ HOTOVO!")
+        if failed:
+            print("⚠️  HOTOVO S CHYBAMI - viz výpis výše")
+        else:
+            print("✅ HOTOVO!")
         print("=" * 60)
         print("\n📁 Vytvořené soubory:")
         print("   - requirements.txt (production)")
@@ -3,6 +3,11 @@
 """Assistant Orchestrator - production version without debug output"""
 
 import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import structlog
 from typing import Callable, Optional
 
@@ -11,9 +16,13 @@ from src.core.ports.i_wake_word_detector import IWakeWordDetector
 from src.core.ports.i_stt_engine import ISTTEngine
 from src.core.ports.i_command_handler import ICommandHandler
 from src.infrastructure.adapters.audio.vad import VADRecorder, RecordingConfig
+from src.core.logging.logger import is_enabled_for
 
 logger = structlog.get_logger()
 
+# Kolik chunků z backlogu se nejvýš vyhodnotí jedním voláním detect()
+WAKE_WORD_MAX_BATCH = 8
+
 
 class AssistantOrchestrator:
     """
@@ -50,6 +59,19 @@ class AssistantOrchestrator:
         self.response_callback: Optional[Callable] = None
         self._calibrated = False
 
+        # Předalokovaný buffer - smyčka wake wordu pak v ustáleném stavu nealokuje.
+        # Pojme celou dávku (aktuální chunk + backlog) za sebou. Stačí jeden:
+        # detect() se dočká (await) dřív, než se do bufferu čte znovu.
+        # Chunk z capture má chunk_size * channels samplů (prokládané kanály).
+        self._chunk_samples = (
+            getattr(audio_input, 'chunk_size', 1280) * getattr(audio_input, 'channels', 1)
+        )
+        self._chunk_buffer = np.empty(self._chunk_samples * WAKE_WORD_MAX_BATCH, dtype=np.int16)
+
+        # Detekce wake wordu běží mimo event loop v jednom dedikovaném vlákně
+        # (vytváří se ve start(), ukončuje ve stop())
+        self._wake_executor: Optional[ThreadPoolExecutor] = None
+
     def set_response_callback(self, callback: Callable):
         """Set callback for streaming response chunks."""
         self.response_callback = callback
@@ -67,6 +89,18 @@ class AssistantOrchestrator:
         self.stream = self.audio.start_stream()
         self.vad_recorder.stream = self.stream
 
+        if self._wake_executor is None:
+            self._wake_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="wake_word"
+            )
+
+        # Warmup STT modelu běží souběžně s kalibrací VAD
+        # (vypnutelné přes ASSISTANT_WARMUP=0, např. pro rychlé testovací běhy)
+        warmup_task = None
+        warmup_enabled = os.getenv("ASSISTANT_WARMUP", "1") != "0"
+        if warmup_enabled and hasattr(self.stt, 'warmup'):
+            warmup_task = asyncio.create_task(self.stt.warmup())
+
         if not self._calibrated:
             try:
                 logger.info("calibrating_vad_background")
@@ -79,27 +113,58 @@ class AssistantOrchestrator:
             except Exception as e:
                 logger.warning("vad_calibration_failed", error=str(e))
 
+        if warmup_task:
+            await warmup_task
+
     async def stop(self):
-        """Stop the assistant"""
+        """Stop the assistant (idempotentní - opakované volání nic nedělá)"""
+        stream, self.stream = self.stream, None
+        executor, self._wake_executor = self._wake_executor, None
+
+        if stream is None and executor is None:
+            return
+
         logger.info("assistant_stopping")
-        if self.stream:
-            self.audio.stop_stream()
+        self.vad_recorder.stream = None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+        if stream is not None:
+            # Zavření zařízení může blokovat - mimo event loop
+            await asyncio.to_thread(self.audio.stop_stream)
 
     async def wait_for_wake_word(self) -> bool:
         """Wait for wake word detection."""
         self.wake_word.reset()
+        loop = asyncio.get_running_loop()
 
         while True:
             try:
-                audio_chunk = await self.audio.read_chunk(self.stream)
+                batch = self._chunk_buffer
+                chunk_size = self._chunk_samples
+                audio_chunk = await self.audio.read_chunk(
+                    self.stream, out=batch[:chunk_size]
+                )
 
-                if self.wake_word.detect(audio_chunk):
+                # Pokud detekce nestíhá, vezmi i chunky čekající v ring bufferu
+                # a vyhodnoť je jedním voláním (bez čekání na nové audio).
+                # Backlog se zapisuje rovnou za aktuální chunk - žádný concatenate.
+                if hasattr(self.audio, 'read_pending_chunks'):
+                    pending = self.audio.read_pending_chunks(
+                        WAKE_WORD_MAX_BATCH - 1, out=batch[chunk_size:]
+                    )
+                    if pending:
+                        audio_chunk = batch[:chunk_size * (len(pending) + 1)]
+
+                detected = await loop.run_in_executor(
+                    self._wake_executor, self.wake_word.detect, audio_chunk
+                )
+                if detected:
                     logger.info("wake_word_detected")
                     self.wake_word.reset()
                     return True
 
-                await asyncio.sleep(0.01)
-
             except Exception as e:
                 logger.error("wake_word_error", error=str(e))
                 await asyncio.sleep(0.1)
@@ -118,15 +183,18 @@ class AssistantOrchestrator:
                 max_duration=10.0
             )
 
+            # Fast path: wake word bez příkazu - ticho nemá smysl posílat do STT
+            # ("❌ No speech detected" vypisuje ConsoleUI pro prázdný výsledek)
+            if metrics.speech_frames == 0:
+                logger.warning("no_speech_captured",
+                               quality_score=metrics.quality_score)
+                return ""
+
             # Check if we got audio
-            if audio_data is None or len(audio_data) == 0:
+            if audio_data is None or audio_data.size == 0:
                 logger.warning("empty_audio_captured",
                                speech_frames=metrics.speech_frames,
                                quality_score=metrics.quality_score)
-
-                # Silent error for user - just return empty
-                if metrics.speech_frames == 0:
-                    print("❌ No speech detected")
                 return ""
 
             # Log quality warning if needed
@@ -134,11 +202,12 @@ class AssistantOrchestrator:
                 logger.warning("low_quality_audio", quality_score=metrics.quality_score)
 
             # Transcribe
-            logger.info("transcribing_audio", size=len(audio_data))
+            logger.info("transcribing_audio", size=audio_data.size)
             text = await self.stt.transcribe(audio_data)
 
             if text:
-                logger.info("transcription_complete", text=text[:100])
+                if is_enabled_for(logging.INFO):
+                    logger.info("transcription_complete", text=text[:100])
             else:
                 logger.warning("transcription_empty")
 
@@ -150,17 +219,20 @@ class AssistantOrchestrator:
 
     def process_command(self, text: str) -> str:
         """Process command and return response."""
-        if not text or len(text.strip()) == 0:
+        if not text or text.isspace():
             logger.debug("empty_command_text")
             return ""
 
-        logger.info("processing_command", text=text[:100])
+        info_enabled = is_enabled_for(logging.INFO)
+        if info_enabled:
+            logger.info("processing_command", text=text[:100])
 
         try:
             response = self.commands.process(text)
 
             if response:
-                logger.info("command_processed", response=response[:100])
+                if info_enabled:
+                    logger.info("command_processed", response=response[:100])
             else:
                 logger.warning("empty_command_response")
 
@@ -170,6 +242,15 @@ class AssistantOrchestrator:
             logger.error("command_processing_error", error=str(e), exc_info=True)
             return f"Omlouvám se, nastala chyba: {str(e)}"
 
+    async def process_command_async(self, text: str) -> str:
+        """
+        Process command mimo event loop.
+
+        Volání AI (HTTP, streaming) je blokující - v threadu nechá event loop
+        dál obsluhovat audio ring buffer z capture callbacku.
+        """
+        return await asyncio.to_thread(self.process_command, text)
+
     def get_last_recording_metrics(self):
         """Vrátí metriky z posledního nahrávání."""
         return self.vad_recorder.get_last_metrics()
@@ -2,14 +2,43 @@
 Context Builder - Sestavuje kontext pro AI modely s dynamickou lokací
 """
 
+import re
+import time
 import structlog
-from typing import Optional
+from typing import Optional, Tuple
 from src.core.config.user_config import UserConfig
 from src.infrastructure.services.core.time_service import TimeService
 from src.infrastructure.services.core.location_service import LocationService
 
 logger = structlog.get_logger()
 
+PROMPT_INTRO = "Jsi inteligentní hlasový asistent."
+
+# Jak dlouho (s) platí lokace v ContextBuilderu - platí i pro fallback při
+# selhání detekce, jinak by se offline zkoušela IP geolokace při každém promptu
+LOCATION_CACHE_TTL = 300.0
+
+# Výchozí/placeholder hodnoty z configu a location service - do promptu nepatří
+PLACEHOLDER_VALUES = frozenset({'User', 'Unknown'})
+
+# Fráze rychlých dotazů podle kategorie (pořadí = priorita)
+QUICK_QUERY_PHRASES = {
+    'time': ('kolik je hodin', 'kolik máme hodin', 'kolik je teď'),
+    'day': ('jaký je den', 'jaký máme den', 'který je den'),
+    'date': ('jaké je datum', 'jaké máme datum', 'které máme datum'),
+    'location': ('kde jsem', 'kde se nacházím', 'v jakém městě jsem'),
+}
+
+# Všechny fráze v jednom předkompilovaném regexu - jeden průchod dotazem,
+# kategorie se pozná podle jména skupiny
+_QUICK_QUERY_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{category}>{'|'.join(map(re.escape, phrases))})"
+        for category, phrases in QUICK_QUERY_PHRASES.items()
+    ),
+    re.IGNORECASE
+)
+
 class ContextBuilder:
     """Sestavuje kompletní kontext pro AI system prompt"""
 
@@ -28,8 +57,32 @@ class ContextBuilder:
         self.user_config = user_config
         self.time_service = time_service
         self.location_service = location_service  # NOVÉ
+
+        # Statické části promptu (z configu) - sestavují se jednou,
+        # dynamická je jen lokace a čas
+        self._static_parts: Optional[dict] = None
+        self._location_cache: Optional[Tuple[float, dict]] = None
+        if hasattr(user_config, 'on_reload'):
+            user_config.on_reload(self.invalidate_cache)
+
         logger.info("context_builder_initialized")
 
+    def invalidate_cache(self) -> None:
+        """Zahoď cachované statické části promptu (např. po reloadu configu)"""
+        self._static_parts = None
+        self._location_cache = None
+        logger.debug("context_builder_cache_invalidated")
+
+    def _get_static_parts(self) -> dict:
+        """Vrátí (a při prvním volání sestaví) statické části promptu"""
+        if self._static_parts is None:
+            self._static_parts = {
+                'user_name': self._build_user_name(),
+                'user_profile': self._build_user_profile(),
+                'instructions': self._build_response_instructions()
+            }
+        return self._static_parts
+
     def build_system_prompt(
         self,
         include_time: bool = True,
@@ -45,13 +98,21 @@ class ContextBuilder:
         Returns:
             Kompletní system prompt
         """
-        parts = ["Jsi inteligentní hlasový asistent."]
+        instructions = self._get_static_parts()['instructions']
+        user_context = self._build_user_context() if include_user_info else ""
+
+        # Fast path (běžný případ, všechny části) - jedno f-string bez listu a join
+        if include_time and user_context:
+            return (
+                f"{PROMPT_INTRO}\n\n{user_context}\n\n"
+                f"{self._build_time_context()}\n\n{instructions}"
+            )
+
+        parts = [PROMPT_INTRO]
 
         # Uživatelský kontext
-        if include_user_info:
-            user_context = self._build_user_context()
-            if user_context:
-                parts.append(user_context)
+        if user_context:
+            parts.append(user_context)
 
         # Časový kontext
         if include_time:
@@ -60,31 +121,45 @@ class ContextBuilder:
                 parts.append(time_context)
 
         # Instrukce pro odpovídání
-        parts.append(self._build_response_instructions())
+        parts.append(instructions)
 
         return "\n\n".join(parts)
 
     def _build_user_context(self) -> str:
         """Sestaví kontext o uživateli s dynamickou lokací"""
-        user_name = self.user_config.get('user.name')
-        occupation = self.user_config.get('personal.occupation')
-        interests = self.user_config.get('personal.interests', [])
+        static = self._get_static_parts()
 
         # ZMĚNA: Dynamická lokace místo statického configu
+        parts = [static['user_name'], self._build_location_context(), static['user_profile']]
+
+        return " ".join(part for part in parts if part)
+
+    def _build_user_name(self) -> str:
+        """Věta se jménem uživatele (statická)"""
+        user_name = self.user_config.get('user.name')
+
+        if user_name and user_name not in PLACEHOLDER_VALUES:
+            return f"Mluvíš s uživatelem jménem {user_name}."
+        return ""
+
+    def _build_location_context(self) -> str:
+        """Věta s aktuální lokací uživatele (dynamická)"""
         location = self._get_location()
         city = location['city']
         country = location['country']
 
-        parts = []
+        if city and city not in PLACEHOLDER_VALUES:
+            if country:
+                return f"Uživatel je aktuálně v městě {city}, {country}."
+            return f"Uživatel je aktuálně v městě {city}."
+        return ""
 
-        if user_name and user_name != 'User':
-            parts.append(f"Mluvíš s uživatelem jménem {user_name}.")
+    def _build_user_profile(self) -> str:
+        """Povolání a zájmy uživatele (statické)"""
+        occupation = self.user_config.get('personal.occupation')
+        interests = self.user_config.get('personal.interests', [])
 
-        if city and city != 'Unknown':
-            if country:
-                parts.append(f"Uživatel je aktuálně v městě {city}, {country}.")
-            else:
-                parts.append(f"Uživatel je aktuálně v městě {city}.")
+        parts = []
 
         if occupation:
             parts.append(f"Pracuje jako {occupation}.")
@@ -93,7 +168,7 @@ class ContextBuilder:
             interests_str = ", ".join(interests)
             parts.append(f"Zajímá se o: {interests_str}.")
 
-        return " ".join(parts) if parts else ""
+        return " ".join(parts)
 
     def _build_time_context(self) -> str:
         """Sestaví časový kontext"""
@@ -115,22 +190,31 @@ Při odpovědích o času používej 24hodinový formát."""
 
     def _get_location(self) -> dict:
         """
-        Získej aktuální lokaci (auto-detect nebo manual)
+        Získej aktuální lokaci (auto-detect nebo manual), cachovanou na
+        LOCATION_CACHE_TTL sekund.
 
         Returns:
             dict: {'city': str, 'country': str, 'timezone': str}
         """
+        now = time.monotonic()
+        cached = self._location_cache
+        if cached is not None and now - cached[0] < LOCATION_CACHE_TTL:
+            return cached[1]
+
         # Check if auto-detect is enabled
         if self.user_config.get('location.auto_detect', True):
-            return self.location_service.get_current_location()
+            location = self.location_service.get_current_location()
         else:
             # Manual location from config
-            return {
+            location = {
                 'city': self.user_config.get('location.manual.city', 'Praha'),
                 'country': self.user_config.get('location.manual.country', 'Česká republika'),
                 'timezone': self.user_config.get('location.manual.timezone', 'Europe/Prague')
             }
 
+        self._location_cache = (now, location)
+        return location
+
     def build_context(self) -> dict:
         """
         Build complete context dict for AI models
@@ -140,11 +224,17 @@ Při odpovědích o času používej 24hodinový formát."""
         """
         location = self._get_location()
         time_context = self.time_service.get_time_context()
+        cfg = self.user_config.get_many({
+            'user.name': 'User',
+            'user.language': 'cs',
+            'preferences.temperature_unit': 'celsius',
+            'preferences.time_format': '24h'
+        })
 
         return {
             # User info
-            'user_name': self.user_config.get('user.name', 'User'),
-            'language': self.user_config.get('user.language', 'cs'),
+            'user_name': cfg['user.name'],
+            'language': cfg['user.language'],
 
             # Location (dynamic)
             'city': location['city'],
@@ -158,8 +248,8 @@ Při odpovědích o času používej 24hodinový formát."""
             'formatted_datetime': time_context['formatted'],
 
             # Preferences
-            'temperature_unit': self.user_config.get('preferences.temperature_unit', 'celsius'),
-            'time_format': self.user_config.get('preferences.time_format', '24h')
+            'temperature_unit': cfg['preferences.temperature_unit'],
+            'time_format': cfg['preferences.time_format']
         }
 
     def get_quick_time_answer(self, query: str) -> Optional[str]:
@@ -172,24 +262,27 @@ Při odpovědích o času používej 24hodinový formát."""
         Returns:
             Odpověď nebo None, pokud není jednoduchý časový dotaz
         """
-        query_lower = query.lower()
-        time_info = self.time_service.get_time_context()
+        categories = {m.lastgroup for m in _QUICK_QUERY_PATTERN.finditer(query)}
+        if not categories:
+            return None
+
+        # NOVÉ: Kde jsem? (nepotřebuje časový kontext)
+        if categories == {'location'}:
+            location = self._get_location()
+            return f"Jsi v {location['city']}, {location['country']}."
+
+        time_strings = self.time_service.get_formatted_strings()
 
         # Kolik je hodin?
-        if any(phrase in query_lower for phrase in ['kolik je hodin', 'kolik máme hodin', 'kolik je teď']):
-            return f"Je {time_info['hour']}:{time_info['minute']}."
+        if 'time' in categories:
+            return f"Je {time_strings['clock']}."
 
         # Jaký je den?
-        if any(phrase in query_lower for phrase in ['jaký je den', 'jaký máme den', 'který je den']):
-            return f"Dnes je {time_info['day_name']}."
+        if 'day' in categories:
+            return f"Dnes je {time_strings['day']}."
 
         # Jaké je datum?
-        if any(phrase in query_lower for phrase in ['jaké je datum', 'jaké máme datum', 'které máme datum']):
-            return f"Dnes je {time_info['day']}. {time_context['month_name']} {time_info['year']}."
-
-        # NOVÉ: Kde jsem?
-        if any(phrase in query_lower for phrase in ['kde jsem', 'kde se nacházím', 'v jakém městě jsem']):
-            location = self._get_location()
-            return f"Jsi v {location['city']}, {location['country']}."
+        if 'date' in categories:
+            return f"Dnes je {time_strings['date']}."
 
         return None
@@ -4,107 +4,234 @@
 Dependency Injection Container - Refactored for maintainability
 """
 
+from __future__ import annotations
+
 import structlog
 import os
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Optional, TypeVar
 from dotenv import load_dotenv
 
 # Core imports
 from src.core.config.user_config import get_user_config, UserConfig
 from src.core.exceptions import ContainerInitializationError
 
-# Infrastructure services
-from src.infrastructure.services import TimeService, LocationService
+# Adaptéry a služby se importují až v příslušné _create_* metodě - import
+# container.py tak nenačítá openai/groq/sounddevice/openwakeword/whisper
+# a těžké importy modelů proběhnou rovnou v background init vláknech
+if TYPE_CHECKING:
+    # Infrastructure services
+    from src.infrastructure.services import TimeService, LocationService
 
-# Application services
-from src.application.services.context_builder import ContextBuilder
-from src.application.services.assistant_orchestrator import AssistantOrchestrator
+    # Application services
+    from src.application.services.context_builder import ContextBuilder
+    from src.application.services.assistant_orchestrator import AssistantOrchestrator
 
-# AI adapters
-from src.infrastructure.adapters.ai.cloud_model_handler import CloudModelHandler
-from src.infrastructure.adapters.ai.local_model_handler import LocalModelHandler
-from src.infrastructure.adapters.ai.hybrid_handler import HybridAIHandler
+    # AI adapters
+    from src.infrastructure.adapters.ai.cloud_model_handler import CloudModelHandler
+    from src.infrastructure.adapters.ai.local_model_handler import LocalModelHandler
+    from src.infrastructure.adapters.ai.hybrid_handler import HybridAIHandler
 
-# Audio adapters
-from src.infrastructure.adapters.audio.sounddevice_capture import SoundDeviceCapture
-from src.infrastructure.adapters.audio.vad import VADRecorder, RecordingConfig
-from src.infrastructure.adapters.wake_word.openwakeword_adapter import OpenWakeWordAdapter
-from src.infrastructure.adapters.stt.hybrid_stt_adapter import HybridSTTAdapter
+    # Audio adapters
+    from src.infrastructure.adapters.audio.sounddevice_capture import SoundDeviceCapture
+    from src.infrastructure.adapters.audio.vad import VADRecorder
+    from src.infrastructure.adapters.wake_word.openwakeword_adapter import OpenWakeWordAdapter
+    from src.infrastructure.adapters.stt.hybrid_stt_adapter import HybridSTTAdapter
 
-# Interface
-from src.interfaces.cli.console_ui import ConsoleUI
+    # Interface
+    from src.interfaces.cli.console_ui import ConsoleUI
 
 logger = structlog.get_logger()
 
+# .env v kořeni projektu - explicitní cesta, python-dotenv pak neprochází adresáře
+DOTENV_PATH = Path(__file__).resolve().parents[3] / ".env"
+
+# .env se parsuje jednou za proces (další Container() už soubor nečte)
+_env_loaded = False
+
+T = TypeVar('T')
+
 
 class Container:
     """
     Dependency Injection Container
     Manages lifecycle and dependencies of all application components.
+
+    Služby se vytváří líně (cached_property) až při prvním přístupu -
+    v __init__ se načte jen prostředí a konfigurace. warmup() volitelně
+    spustí pomalé a navzájem nezávislé části startu (modely wake word
+    a Whisper, detekce lokace pro timezone, kontrola dostupnosti Ollamy)
+    souběžně na pozadí a jejich properties si pak jen vyzvednou výsledek.
     """
 
+    # Služby, které warmup() vytváří na pozadí - I/O-bound (disk, síť)
+    # a navzájem nezávislé; factory metoda je vždy _create_<jméno>
+    WARMUP_SERVICES = ("wake_word_detector", "stt_engine", "time_service", "local_handler")
+
     def __init__(self):
-        """Initialize container with all dependencies"""
+        """Load environment and configuration; services are created on demand"""
         logger.info("container_initialization_started")
 
+        # Rozběhnuté background vytváření služeb (jméno -> Future), viz warmup()
+        self._warmup_futures: Dict[str, Future] = {}
+
         try:
-            # Step 1: Environment and configuration
+            # Environment and configuration
             self._load_environment()
             self.user_config = self._load_user_config()
 
-            # Step 2: Core infrastructure services
-            self.location_service = self._create_location_service()
-            self.time_service = self._create_time_service()
-
-            # Step 3: Application services
-            self.context_builder = self._create_context_builder()
+            logger.info("container_initialization_completed")
 
-            # Step 4: AI handlers
-            self.cloud_handler = self._create_cloud_handler()
-            self.local_handler = self._create_local_handler()
-            self.command_handler = self._create_hybrid_handler()
+        except Exception as e:
+            logger.error("container_initialization_failed", error=str(e), exc_info=True)
+            raise ContainerInitializationError(f"Failed to initialize container: {e}") from e
 
-            # Step 5: Audio pipeline
-            self.audio_input = self._create_audio_input()
-            self.vad_recorder = self._create_vad_recorder()
-            self.wake_word_detector = self._create_wake_word_detector()
-            self.stt_engine = self._create_stt_engine()
+    def warmup(self) -> None:
+        """
+        Start creating the slow, independent services in background threads.
 
-            # Step 6: Main orchestrator
-            self.orchestrator = self._create_orchestrator()
+        Start pak trvá zhruba jako nejpomalejší z nich místo jejich součtu.
+        Vlákna jsou daemon - neblokují ukončení interpretu. Opakované volání
+        nic nedělá; už vytvořené služby se přeskočí.
+        """
+        if self._warmup_futures:
+            return
+
+        # LocationService je levný (bez sítě) a time service na něm závisí -
+        # vytvoří se tady, aby ho background vlákno jen použilo
+        self.location_service
+
+        for name in self.WARMUP_SERVICES:
+            if name in self.__dict__:
+                continue
+
+            future: Future = Future()
+            self._warmup_futures[name] = future
+            threading.Thread(
+                target=self._run_warmup,
+                args=(future, getattr(self, f"_create_{name}")),
+                name=f"container_warmup_{name}",
+                daemon=True
+            ).start()
+
+        logger.debug("container_warmup_started", services=list(self._warmup_futures))
+
+    @staticmethod
+    def _run_warmup(future: Future, factory: Callable[[], object]) -> None:
+        """Vytvoř službu ve warmup vlákně a výsledek (nebo chybu) předej do future"""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(factory())
+        except BaseException as e:
+            future.set_exception(e)
 
-            logger.info("container_initialization_completed")
+    def _resolve(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Vrať službu - z warmup vlákna, pokud ho warmup() spustil, jinak ji vytvoř hned.
 
+        Raises:
+            ContainerInitializationError: If the service cannot be created
+        """
+        try:
+            future = self._warmup_futures.get(name)
+            if future is not None:
+                return future.result()
+            return factory()
+        except ContainerInitializationError:
+            raise
         except Exception as e:
-            logger.error("container_initialization_failed", error=str(e), exc_info=True)
-            raise ContainerInitializationError(f"Failed to initialize container: {e}") from e
+            raise ContainerInitializationError(f"Failed to create {name}: {e}") from e
+
+    # ========================================
+    # LAZY SERVICES
+    # ========================================
+
+    @cached_property
+    def location_service(self) -> LocationService:
+        return self._resolve("location_service", self._create_location_service)
+
+    @cached_property
+    def time_service(self) -> TimeService:
+        return self._resolve("time_service", self._create_time_service)
+
+    @cached_property
+    def context_builder(self) -> ContextBuilder:
+        return self._resolve("context_builder", self._create_context_builder)
+
+    @cached_property
+    def cloud_handler(self) -> CloudModelHandler:
+        return self._resolve("cloud_handler", self._create_cloud_handler)
+
+    @cached_property
+    def local_handler(self) -> LocalModelHandler:
+        return self._resolve("local_handler", self._create_local_handler)
+
+    @cached_property
+    def command_handler(self) -> HybridAIHandler:
+        return self._resolve("command_handler", self._create_hybrid_handler)
+
+    @cached_property
+    def audio_input(self) -> SoundDeviceCapture:
+        return self._resolve("audio_input", self._create_audio_input)
+
+    @cached_property
+    def vad_recorder(self) -> VADRecorder:
+        return self._resolve("vad_recorder", self._create_vad_recorder)
+
+    @cached_property
+    def wake_word_detector(self) -> OpenWakeWordAdapter:
+        return self._resolve("wake_word_detector", self._create_wake_word_detector)
+
+    @cached_property
+    def stt_engine(self) -> HybridSTTAdapter:
+        return self._resolve("stt_engine", self._create_stt_engine)
+
+    @cached_property
+    def orchestrator(self) -> AssistantOrchestrator:
+        return self._resolve("orchestrator", self._create_orchestrator)
 
     # ========================================
     # ENVIRONMENT & CONFIG
     # ========================================
 
     def _load_environment(self) -> None:
-        """Load environment variables from .env file"""
+        """Load environment variables from .env file (once per process)"""
+        global _env_loaded
         try:
-            load_dotenv()
-            openai_key_present = bool(os.getenv("OPENAI_API_KEY"))
-            groq_key_present = bool(os.getenv("GROQ_API_KEY"))
-
-            logger.info(
-                "environment_loaded",
-                openai_key_present=openai_key_present,
-                groq_key_present=groq_key_present
-            )
-
-            if not (openai_key_present or groq_key_present):
-                logger.warning(
-                    "no_api_keys_configured",
-                    message="Neither OpenAI nor Groq API keys found. AI features may not work."
-                )
-
+            if not _env_loaded:
+                load_dotenv(dotenv_path=DOTENV_PATH, verbose=False)
+                _env_loaded = True
         except Exception as e:
             logger.error("environment_load_failed", error=str(e))
-            pass
+
+        # Jednorázový (read-only) snapshot proměnných, které čtou factory metody -
+        # jeden průchod os.environ, konzistentní i při paralelní inicializaci
+        # v background vláknech
+        environ = os.environ
+        self.env = MappingProxyType({
+            "OPENAI_API_KEY": environ.get("OPENAI_API_KEY"),
+            "GROQ_API_KEY": environ.get("GROQ_API_KEY", "")
+        })
+
+        openai_key_present = bool(self.env["OPENAI_API_KEY"])
+        groq_key_present = bool(self.env["GROQ_API_KEY"])
+
+        logger.info(
+            "environment_loaded",
+            openai_key_present=openai_key_present,
+            groq_key_present=groq_key_present
+        )
+
+        if not (openai_key_present or groq_key_present):
+            logger.warning(
+                "no_api_keys_configured",
+                message="Neither OpenAI nor Groq API keys found. AI features may not work."
+            )
 
     def _load_user_config(self) -> UserConfig:
         """Load and validate user configuration"""
@@ -123,6 +250,8 @@ class Container:
     def _create_location_service(self) -> LocationService:
         """Create location detection service"""
         try:
+            from src.infrastructure.services.core.location_service import LocationService
+
             service = LocationService()
             logger.debug("location_service_created")
             return service
@@ -132,6 +261,8 @@ class Container:
 
     def _create_time_service(self) -> TimeService:
         """Create time service with appropriate timezone"""
+        from src.infrastructure.services.core.time_service import TimeService
+
         try:
             timezone = self.location_service.get_timezone(self.user_config)
             service = TimeService(timezone=timezone)
@@ -148,6 +279,8 @@ class Container:
     def _create_context_builder(self) -> ContextBuilder:
         """Create context builder for AI prompts"""
         try:
+            from src.application.services.context_builder import ContextBuilder
+
             builder = ContextBuilder(
                 user_config=self.user_config,
                 time_service=self.time_service,
@@ -166,7 +299,9 @@ class Container:
     def _create_cloud_handler(self) -> CloudModelHandler:
         """Create cloud AI model handler (OpenAI)"""
         try:
-            api_key = os.getenv("OPENAI_API_KEY")
+            from src.infrastructure.adapters.ai.cloud_model_handler import CloudModelHandler
+
+            api_key = self.env["OPENAI_API_KEY"]
             provider = self.user_config.get('models.cloud.provider', 'openai')
             streaming = self.user_config.get('models.cloud.streaming', True)
 
@@ -190,6 +325,8 @@ class Container:
     def _create_local_handler(self) -> LocalModelHandler:
         """Create local AI model handler (Ollama)"""
         try:
+            from src.infrastructure.adapters.ai.local_model_handler import LocalModelHandler
+
             handler = LocalModelHandler()
             logger.debug("local_handler_created")
             return handler
@@ -200,6 +337,8 @@ class Container:
     def _create_hybrid_handler(self) -> HybridAIHandler:
         """Create hybrid AI handler with intelligent routing"""
         try:
+            from src.infrastructure.adapters.ai.hybrid_handler import HybridAIHandler
+
             strategy = self.user_config.get('routing.strategy', 'intelligent')
             handler = HybridAIHandler(
                 cloud_handler=self.cloud_handler,
@@ -219,19 +358,25 @@ class Container:
     def _create_audio_input(self) -> SoundDeviceCapture:
         """Create audio input device"""
         try:
+            from src.infrastructure.adapters.audio.sounddevice_capture import SoundDeviceCapture
+
             audio_config = self.user_config.get('audio', {})
 
+            # Hodnoty se vyhodnotí jednou a použijí pro konstruktor i log
+            sample_rate = audio_config.get('sample_rate', 16000)
+            gain = audio_config.get('gain', 6.0)
+
             device = SoundDeviceCapture(
-                sample_rate=audio_config.get('sample_rate', 16000),
+                sample_rate=sample_rate,
                 channels=audio_config.get('channels', 1),
                 chunk_size=audio_config.get('chunk_size', 1280),
-                gain=audio_config.get('gain', 6.0)
+                gain=gain
             )
 
             logger.debug(
                 "audio_input_created",
-                sample_rate=audio_config.get('sample_rate', 16000),
-                gain=audio_config.get('gain', 6.0)
+                sample_rate=sample_rate,
+                gain=gain
             )
 
             return device
@@ -245,6 +390,8 @@ class Container:
         Clean production version without debug banner.
         """
         try:
+            from src.infrastructure.adapters.audio.vad import VADRecorder, RecordingConfig
+
             vad_config_dict = self.user_config.get('audio.vad', {})
 
             # ULTRA-FAST defaults - overridable from config
@@ -268,7 +415,7 @@ class Container:
 
                 # VAD (legacy, not used)
                 vad_aggressiveness=vad_config_dict.get('vad_aggressiveness', 0),
-                sample_rate=self.user_config.get('audio.sample_rate', 16000),
+                sample_rate=getattr(self.audio_input, 'sample_rate', 16000),
                 frame_duration_ms=vad_config_dict.get('frame_duration_ms', 30),
 
                 # Advanced
@@ -298,6 +445,8 @@ class Container:
     def _create_wake_word_detector(self) -> OpenWakeWordAdapter:
         """Create wake word detection adapter"""
         try:
+            from src.infrastructure.adapters.wake_word.openwakeword_adapter import OpenWakeWordAdapter
+
             keywords = self.user_config.get('audio.wake_word_models', ['alexa'])
             threshold = self.user_config.get('assistant.wake_word_threshold', 0.5)
 
@@ -320,7 +469,9 @@ class Container:
     def _create_stt_engine(self) -> HybridSTTAdapter:
         """Create speech-to-text engine"""
         try:
-            groq_api_key = os.getenv("GROQ_API_KEY", "")
+            from src.infrastructure.adapters.stt.hybrid_stt_adapter import HybridSTTAdapter
+
+            groq_api_key = self.env["GROQ_API_KEY"]
             whisper_model = self.user_config.get('audio.stt.whisper_model', 'small')
             language = self.user_config.get('user.language', 'cs')
 
@@ -331,7 +482,8 @@ class Container:
             engine = HybridSTTAdapter(
                 groq_api_key=groq_api_key,
                 whisper_model=whisper_model,
-                language=language
+                language=language,
+                user_config=self.user_config
             )
 
             logger.debug(
@@ -353,6 +505,8 @@ class Container:
     def _create_orchestrator(self) -> AssistantOrchestrator:
         """Create main assistant orchestrator"""
         try:
+            from src.application.services.assistant_orchestrator import AssistantOrchestrator
+
             orchestrator = AssistantOrchestrator(
                 audio_input=self.audio_input,
                 wake_word_detector=self.wake_word_detector,
@@ -374,12 +528,19 @@ class Container:
 
     def console_ui(self) -> ConsoleUI:
         """
-        Create console UI interface
+        Get console UI interface (created on first call, then reused)
 
         Returns:
             ConsoleUI instance configured with orchestrator
         """
+        return self._console_ui
+
+    @cached_property
+    def _console_ui(self) -> ConsoleUI:
+        """Create console UI interface"""
         try:
+            from src.interfaces.cli.console_ui import ConsoleUI
+
             ui = ConsoleUI(
                 orchestrator=self.orchestrator,
                 user_config=self.user_config
@@ -391,14 +552,33 @@ class Container:
             raise
 
 
+# Globální instance containeru (singleton) - opakované volání setup_container()
+# nevytváří znovu adaptéry ani nenačítá modely
+_container: Optional[Container] = None
+_container_lock = threading.Lock()
+
+
 def setup_container() -> Container:
     """
     Setup and initialize dependency injection container
 
     Returns:
-        Fully initialized Container instance
+        Process-wide Container instance (services are created on first access)
 
     Raises:
         ContainerInitializationError: If initialization fails
     """
-    return Container()
+    global _container
+    if _container is None:
+        with _container_lock:
+            # Double-checked locking - jiné vlákno mohlo container mezitím vytvořit
+            if _container is None:
+                _container = Container()
+    return _container
+
+
+def reset_container() -> None:
+    """Zahoď globální container (pro testy) - další setup_container() vytvoří nový"""
+    global _container
+    with _container_lock:
+        _container = None
@@ -1,10 +1,12 @@
 # src/core/config/pattern_config.py
 
-from typing import Set, List, Dict, Any
+from typing import FrozenSet, List, Dict, Any, Optional
 from pathlib import Path
+import threading
 import yaml
 from dataclasses import dataclass
 
+from src.core.config.yaml_loader import load_yaml
 from src.core.exceptions import InvalidConfigError
 from src.core.logging.logger import get_logger
 
@@ -29,8 +31,8 @@ class ScoringWeights:
 @dataclass
 class CustomRules:
     """Custom pravidla pro detekci."""
-    always_commands: Set[str]
-    never_commands: Set[str]
+    always_commands: FrozenSet[str]
+    never_commands: FrozenSet[str]
 
 
 class CommandPatternConfig:
@@ -50,14 +52,15 @@ class CommandPatternConfig:
 
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = load_yaml(f)
 
-            # Parse patterns
+            # Parse patterns - frozenset: po načtení se jen čtou (i z více vláken),
+            # runtime úpravy sadu nahrazují novou
             patterns = config.get('patterns', {})
-            self.command_verbs = set(patterns.get('command_verbs', []))
-            self.question_words = set(patterns.get('question_words', []))
-            self.conversation_indicators = set(patterns.get('conversation_indicators', []))
-            self.sentence_enders = set(patterns.get('sentence_enders', []))
+            self.command_verbs = frozenset(patterns.get('command_verbs', []))
+            self.question_words = frozenset(patterns.get('question_words', []))
+            self.conversation_indicators = frozenset(patterns.get('conversation_indicators', []))
+            self.sentence_enders = frozenset(patterns.get('sentence_enders', []))
 
             # Parse scoring
             scoring = config.get('scoring', {})
@@ -77,8 +80,8 @@ class CommandPatternConfig:
             # Parse custom rules
             custom = config.get('custom_rules', {})
             self.custom_rules = CustomRules(
-                always_commands=set(custom.get('always_commands', [])),
-                never_commands=set(custom.get('never_commands', []))
+                always_commands=frozenset(custom.get('always_commands', [])),
+                never_commands=frozenset(custom.get('never_commands', []))
             )
 
             # Settings
@@ -100,14 +103,14 @@ class CommandPatternConfig:
 
     def add_command_verb(self, verb: str) -> None:
         """Dynamicky přidá command verb (pro runtime customization)."""
-        self.command_verbs.add(verb.lower() if not self.case_sensitive else verb)
+        self.command_verbs = self.command_verbs | {verb.lower() if not self.case_sensitive else verb}
         logger.debug(f"Added command verb: {verb}")
 
     def add_custom_command(self, phrase: str) -> None:
         """Přidá custom příkaz do always_commands."""
-        self.custom_rules.always_commands.add(
+        self.custom_rules.always_commands = self.custom_rules.always_commands | {
             phrase.lower() if not self.case_sensitive else phrase
-        )
+        }
         logger.debug(f"Added custom command: {phrase}")
 
     def to_dict(self) -> Dict[str, Any]:
@@ -139,11 +142,14 @@ class CommandPatternConfig:
 
 # Singleton instance
 _pattern_config: Optional[CommandPatternConfig] = None
+_pattern_config_lock = threading.Lock()
 
 
 def get_pattern_config(config_path: str = "config/command_patterns.yaml") -> CommandPatternConfig:
     """Get singleton instance of pattern config."""
     global _pattern_config
     if _pattern_config is None:
-        _pattern_config = CommandPatternConfig(config_path)
+        with _pattern_config_lock:
+            if _pattern_config is None:
+                _pattern_config = CommandPatternConfig(config_path)
     return _pattern_config
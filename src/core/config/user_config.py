@@ -6,9 +6,12 @@ Načítá a spravuje uživatelskou konfiguraci s validací
 import yaml
 import os
 import structlog
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, TypeVar, Union
 
+from src.core.config.yaml_loader import load_yaml
+
 logger = structlog.get_logger()
 
 T = TypeVar('T')
@@ -30,7 +33,15 @@ class UserConfig:
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
         self.validation_errors: list = []
+        self._reload_callbacks: list = []
+        # Plochý index {"a.b.c": hodnota} - get() je pak jeden dict lookup
+        self._flat: Dict[str, Any] = {}
+        # Klíče, u kterých už byl zalogován type mismatch (varuje se jednou za načtení)
+        self._type_mismatches: set = set()
+        # (st_mtime_ns, st_size) načteného souboru - reload() nezměněný soubor neparsuje
+        self._file_signature: Optional[tuple] = None
         self._load_config()
+        self._index_config()
         self._validate_config()
 
     def _load_config(self) -> None:
@@ -41,8 +52,10 @@ class UserConfig:
                 self._create_default_config()
                 return
 
+            signature = self._stat_signature()
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f) or {}
+                self.config = load_yaml(f) or {}
+            self._file_signature = signature
 
             logger.info("user_config_loaded",
                         user_name=self.config.get('user', {}).get('name', 'Unknown'))
@@ -51,6 +64,30 @@ class UserConfig:
             logger.error("config_load_error", error=str(e))
             raise ConfigValidationError(f"Failed to load config: {e}")
 
+    def _stat_signature(self) -> Optional[tuple]:
+        """Podpis souboru pro detekci změn (None, pokud soubor nejde stat-nout)"""
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _index_config(self) -> None:
+        """Sestav plochý index všech cest v konfiguraci (včetně vnořených sekcí)"""
+        flat: Dict[str, Any] = {}
+        stack = [("", self.config)]
+
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+
+        self._flat = flat
+        self._type_mismatches = set()
+
     def _validate_config(self) -> None:
         """Validuj konfiguraci"""
         self.validation_errors = []
@@ -315,20 +352,15 @@ class UserConfig:
         Returns:
             Hodnota z konfigurace nebo default
         """
-        keys = key_path.split('.')
-        value = self.config
-
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-                if value is None:
-                    return default
-            else:
-                return default
+        value = self._flat.get(key_path)
+        if value is None:
+            return default
 
         # Simple type checking
-        if value is not None and default is not None:
-            if type(value) != type(default):
+        if default is not None and type(value) is not type(default):
+            # Hodnoty se nemění mezi reloady - stačí zalogovat jednou, ne při každém get()
+            if key_path not in self._type_mismatches:
+                self._type_mismatches.add(key_path)
                 logger.warning(
                     "config_type_mismatch",
                     key=key_path,
@@ -336,10 +368,22 @@ class UserConfig:
                     got=type(value).__name__,
                     value=str(value)[:100]
                 )
-                return default
+            return default
 
         return value
 
+    def get_many(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Získej více hodnot najednou.
+
+        Args:
+            defaults: {cesta: výchozí hodnota}
+
+        Returns:
+            {cesta: hodnota z konfigurace nebo default}
+        """
+        return {key_path: self.get(key_path, default) for key_path, default in defaults.items()}
+
     def get_typed(self, key_path: str, default: T, expected_type: type = None) -> T:
         """
         Získej hodnotu s explicitní type checking.
@@ -366,12 +410,39 @@ class UserConfig:
 
         return value
 
-    def reload(self) -> None:
-        """Znovu načti konfiguraci ze souboru"""
+    def reload(self, force: bool = False) -> None:
+        """
+        Znovu načti konfiguraci ze souboru.
+
+        Pokud se soubor od posledního načtení nezměnil (mtime + velikost),
+        parsování, validace i reload callbacky se přeskočí.
+
+        Args:
+            force: Načti znovu i nezměněný soubor
+        """
+        if (
+            not force
+            and self._file_signature is not None
+            and self._stat_signature() == self._file_signature
+        ):
+            logger.debug("config_unchanged_skip_reload")
+            return
+
         logger.info("reloading_config")
         self._load_config()
+        self._index_config()
         self._validate_config()
 
+        for callback in self._reload_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error("config_reload_callback_error", error=str(e))
+
+    def on_reload(self, callback) -> None:
+        """Zaregistruj callback volaný po každém reload() (invalidace cache)"""
+        self._reload_callbacks.append(callback)
+
     def is_valid(self) -> bool:
         """Check if configuration is valid"""
         return len(self.validation_errors) == 0
@@ -383,6 +454,7 @@ class UserConfig:
 
 # Singleton instance
 _user_config: Optional[UserConfig] = None
+_user_config_lock = threading.Lock()
 
 
 def get_user_config(config_path: str = "config/user_config.yaml") -> UserConfig:
@@ -400,5 +472,8 @@ def get_user_config(config_path: str = "config/user_config.yaml") -> UserConfig:
     """
     global _user_config
     if _user_config is None:
-        _user_config = UserConfig(config_path)
+        with _user_config_lock:
+            # Double-checked locking - container init vlákna mohou volat souběžně
+            if _user_config is None:
+                _user_config = UserConfig(config_path)
     return _user_config
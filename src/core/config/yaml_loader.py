@@ -0,0 +1,24 @@
+"""Sdílené načítání YAML konfigurace"""
+
+from typing import IO, Any
+
+import yaml
+
+# libyaml (C) loader, pokud je PyYAML zkompilovaný s libyaml - jinak čistě Python SafeLoader
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def load_yaml(stream: IO[str]) -> Any:
+    """
+    Naparsuj YAML dokument bezpečným loaderem (ekvivalent yaml.safe_load).
+
+    Args:
+        stream: Otevřený soubor nebo řetězec s YAML
+
+    Returns:
+        Naparsovaný dokument (None pro prázdný vstup)
+    """
+    return yaml.load(stream, Loader=SafeLoader)
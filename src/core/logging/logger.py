@@ -5,6 +5,20 @@ import logging
 import sys
 from pathlib import Path
 
+# Minimální level, který structlog skutečně zpracuje (nastavuje setup_logging)
+_structlog_min_level = logging.DEBUG
+
+
+def is_enabled_for(level: int) -> bool:
+    """
+    Projde zpráva daného levelu filtrem structlogu?
+
+    Na hot path umožní přeskočit přípravu argumentů (slicing textu apod.)
+    pro zprávy, které by filtering logger stejně zahodil.
+    """
+    return level >= _structlog_min_level
+
+
 def setup_logging(
     mode: str = "production",
     terminal_level: str = "ERROR",  # ZMĚNA: Jen ERROR v production
@@ -16,6 +30,8 @@ def setup_logging(
     - Terminal: minimal output (ERROR+ in production, INFO+ in dev)
     - File: complete logs (DEBUG+)
     """
+    global _structlog_min_level
+
     # Vytvoř logs složku
     Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
@@ -58,6 +74,8 @@ def setup_logging(
     root_logger.addHandler(console_handler)
 
     # ===== STRUCTLOG =====
+    _structlog_min_level = logging.DEBUG if mode == "development" else logging.ERROR
+
     if mode == "development":
         structlog.configure(
             processors=[
@@ -65,7 +83,7 @@ def setup_logging(
                 structlog.processors.add_log_level,
                 structlog.dev.ConsoleRenderer(colors=use_colors)
             ],
-            wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG),
+            wrapper_class=structlog.make_filtering_bound_logger(_structlog_min_level),
             context_class=dict,
             logger_factory=structlog.PrintLoggerFactory(),
             cache_logger_on_first_use=True,
@@ -81,7 +99,7 @@ def setup_logging(
                 structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
             ],
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR),  # ZMĚNA
+            wrapper_class=structlog.make_filtering_bound_logger(_structlog_min_level),  # ZMĚNA
             cache_logger_on_first_use=True,
         )
 
@@ -13,8 +13,8 @@ class IAudioInput(ABC):
         pass
     
     @abstractmethod
-    async def read_chunk(self, stream) -> np.ndarray:
-        """Read single audio chunk from stream"""
+    async def read_chunk(self, stream, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Read single audio chunk from stream (optionally into preallocated `out`)"""
         pass
     
     @abstractmethod
@@ -8,9 +8,23 @@ import structlog
 from typing import Tuple, Dict, Any
 from enum import Enum
 
+from src.core.text_patterns import compile_keywords
+
 logger = structlog.get_logger()
 
 
+# Citlivá slova (fáze 1) a placeholder odpovědi (fáze 5) - sestaví se jednou při importu
+SENSITIVE_WORDS = ('heslo', 'pin', 'kód', 'číslo karty', 'rodné číslo', 'účet')
+PLACEHOLDER_PHRASES = (
+    'nevím', 'nenašel jsem', 'nerozumím',
+    'nedokážu', 'nemohu', 'pracuji na implementaci',
+    'placeholder'
+)
+
+_SENSITIVE_WORDS_RE = compile_keywords(SENSITIVE_WORDS)
+_PLACEHOLDER_PHRASES_RE = compile_keywords(PLACEHOLDER_PHRASES)
+
+
 class RoutingDecision(Enum):
     FORCE_LOCAL = "force_local"
     FORCE_CLOUD = "force_cloud"
@@ -49,6 +63,11 @@ class IntelligentRouter:
             'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
             'phone': r'\b(\+420)?\s?\d{3}\s?\d{3}\s?\d{3}\b'
         }
+        # Plochá tuple (typ, zkompilovaný regex) - bez iterace dictu a re cache lookupu
+        self._pii_checks = tuple(
+            (pii_type, re.compile(pattern))
+            for pii_type, pattern in self.pii_patterns.items()
+        )
         
         # Fáze 3: Intent keywords
         self.simple_keywords = [
@@ -62,12 +81,17 @@ class IntelligentRouter:
             'sumarizuj', 'shrň', 'recept', 'jak funguje', 'co znamená',
             'proč', 'jaký je rozdíl', 'vytvoř', 'doporuč'
         ]
+
+        # Předkompilované alternace - místo smyčky přes `in` jedno hledání v C
+        self._simple_keywords_re = compile_keywords(self.simple_keywords)
+        self._complex_keywords_re = compile_keywords(self.complex_keywords)
         
         logger.info("intelligent_router_initialized", preference=user_preference)
     
     
     def route(self, text: str, asr_confidence: float = 1.0, 
-              session_context_length: int = 0) -> Tuple[RoutingDecision, Dict[str, Any]]:
+              session_context_length: int = 0,
+              text_lower: str = None) -> Tuple[RoutingDecision, Dict[str, Any]]:
         """
         Hlavní routovací logika - 5-fázová kaskáda
         
@@ -75,10 +99,15 @@ class IntelligentRouter:
             text: Přepsaný text z STT
             asr_confidence: Confidence score z ASR (0-1)
             session_context_length: Délka konverzace v tokenech
+            text_lower: Už normalizovaný (lowercase) text, pokud ho volající má
             
         Returns:
             (decision, metadata) - routing decision a metadata
         """
+        # Lowercase jednou pro všechny fáze (nebo převzít od volajícího)
+        if text_lower is None:
+            text_lower = text.lower()
+
         metadata = {
             'text_length': len(text),
             'word_count': len(text.split()),
@@ -87,7 +116,7 @@ class IntelligentRouter:
         }
         
         # FÁZE 1: Bezpečnostní kontrola (0-20ms)
-        decision, reason = self._phase1_privacy_check(text)
+        decision, reason = self._phase1_privacy_check(text, text_lower)
         if decision:
             metadata['phase'] = 1
             metadata['reason'] = reason
@@ -103,7 +132,7 @@ class IntelligentRouter:
             return decision, metadata
         
         # FÁZE 3: Intent klasifikace (25-55ms)
-        intent, confidence = self._phase3_intent_classification(text)
+        intent, confidence = self._phase3_intent_classification(text, text_lower)
         metadata['intent'] = intent.value
         metadata['intent_confidence'] = confidence
         
@@ -130,23 +159,25 @@ class IntelligentRouter:
         return decision, metadata
     
     
-    def _phase1_privacy_check(self, text: str) -> Tuple[RoutingDecision, str]:
+    def _phase1_privacy_check(self, text: str, text_lower: str = None) -> Tuple[RoutingDecision, str]:
         """
         Fáze 1: Detekce PII (osobních údajů)
         Pokud najde citlivá data → FORCE_LOCAL
         """
-        for pii_type, pattern in self.pii_patterns.items():
-            if re.search(pattern, text):
+        for pii_type, pattern in self._pii_checks:
+            if pattern.search(text):
                 logger.warning("pii_detected", type=pii_type)
                 return RoutingDecision.FORCE_LOCAL, f"pii_detected_{pii_type}"
         
         # Kontrola citlivých slov
-        sensitive_words = ['heslo', 'pin', 'kód', 'číslo karty', 'rodné číslo', 'účet']
-        text_lower = text.lower()
-        for word in sensitive_words:
-            if word in text_lower:
-                logger.warning("sensitive_keyword_detected", keyword=word)
-                return RoutingDecision.FORCE_LOCAL, f"sensitive_keyword_{word}"
+        if text_lower is None:
+            text_lower = text.lower()
+        # Regex jen rychle vyloučí běžný text bez citlivých slov; do důvodu jde
+        # první slovo v pořadí SENSITIVE_WORDS (ne první výskyt v textu)
+        if _SENSITIVE_WORDS_RE.search(text_lower):
+            word = next(word for word in SENSITIVE_WORDS if word in text_lower)
+            logger.warning("sensitive_keyword_detected", keyword=word)
+            return RoutingDecision.FORCE_LOCAL, f"sensitive_keyword_{word}"
         
         return None, None
     
@@ -163,12 +194,13 @@ class IntelligentRouter:
         return None, None
     
     
-    def _phase3_intent_classification(self, text: str) -> Tuple[IntentCategory, float]:
+    def _phase3_intent_classification(self, text: str, text_lower: str = None) -> Tuple[IntentCategory, float]:
         """
         Fáze 3: Klasifikace intentu (záměru)
         Returns: (category, confidence_score)
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         words = text_lower.split()
         word_count = len(words)
         
@@ -183,15 +215,11 @@ class IntelligentRouter:
             complex_score += 0.3
         
         # 2. Klíčová slova
-        for keyword in self.simple_keywords:
-            if keyword in text_lower:
-                simple_score += 0.4
-                break
+        if self._simple_keywords_re.search(text_lower):
+            simple_score += 0.4
         
-        for keyword in self.complex_keywords:
-            if keyword in text_lower:
-                complex_score += 0.5
-                break
+        if self._complex_keywords_re.search(text_lower):
+            complex_score += 0.5
         
         # 3. Syntaktické znaky
         if '?' in text and word_count > 6:
@@ -243,17 +271,11 @@ class IntelligentRouter:
         Vyhodnotí kvalitu lokální odpovědi
         """
         # Detekce placeholder odpovědí
-        placeholder_phrases = [
-            'nevím', 'nenašel jsem', 'nerozumím', 
-            'nedokážu', 'nemohu', 'pracuji na implementaci',
-            'placeholder'
-        ]
-        
         response_lower = local_response.lower()
-        for phrase in placeholder_phrases:
-            if phrase in response_lower:
-                logger.info("escalating_to_cloud", reason=f"placeholder_{phrase}")
-                return True
+        if _PLACEHOLDER_PHRASES_RE.search(response_lower):
+            phrase = next(phrase for phrase in PLACEHOLDER_PHRASES if phrase in response_lower)
+            logger.info("escalating_to_cloud", reason=f"placeholder_{phrase}")
+            return True
         
         # Odpověď je příliš krátká pro složitý dotaz
         query_words = len(query.split())
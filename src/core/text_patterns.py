@@ -0,0 +1,15 @@
+"""Sdílené pomocné funkce pro předkompilované textové vzory"""
+
+import re
+from typing import Iterable
+
+
+def compile_keywords(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Zkompiluj seznam klíčových slov do jednoho regexu (alternace).
+
+    Klíčová slova se escapují a hledají jako podřetězce - `search()` se chová
+    jako `any(keyword in text ...)`, ale jedním průchodem textem v C.
+    Porovnání je case-sensitive; volající předává už lowercase text.
+    """
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
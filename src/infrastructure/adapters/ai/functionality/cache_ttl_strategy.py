@@ -5,6 +5,8 @@
 import re
 from typing import Optional
 
+from src.core.text_patterns import compile_keywords
+
 
 class CacheTTLStrategy:
     """
@@ -40,37 +42,45 @@ class CacheTTLStrategy:
     # Math/calculation patterns (infinite TTL)
     MATH_PATTERN = re.compile(r'\d+\s*[\+\-\*\/]\s*\d+')
 
+    # Jeden regex na kategorii - jeden průchod dotazem v C místo any(... in ...)
+    TIME_PATTERN = compile_keywords(TIME_KEYWORDS)
+    WEATHER_PATTERN = compile_keywords(WEATHER_KEYWORDS)
+    DATE_PATTERN = compile_keywords(DATE_KEYWORDS)
+    FACTUAL_PATTERN = compile_keywords(FACTUAL_KEYWORDS)
+
     @classmethod
-    def get_ttl(cls, query: str) -> float:
+    def get_ttl(cls, query: str, query_lower: Optional[str] = None) -> float:
         """
         Determine TTL in seconds based on query content.
 
         Args:
             query: User query text
+            query_lower: Already normalized (lowercased, stripped) query
 
         Returns:
             TTL in seconds (0 = no cache, inf = forever)
         """
-        query_lower = query.lower().strip()
+        if query_lower is None:
+            query_lower = query.lower().strip()
 
         # 1. Math/calculations - cache forever
         if cls.MATH_PATTERN.search(query_lower):
             return float('inf')
 
         # 2. Time-sensitive queries - very short TTL
-        if any(keyword in query_lower for keyword in cls.TIME_KEYWORDS):
+        if cls.TIME_PATTERN.search(query_lower):
             return 30.0  # 30 seconds
 
         # 3. Weather queries - medium TTL
-        if any(keyword in query_lower for keyword in cls.WEATHER_KEYWORDS):
+        if cls.WEATHER_PATTERN.search(query_lower):
             return 1800.0  # 30 minutes
 
         # 4. Date/day queries - short TTL
-        if any(keyword in query_lower for keyword in cls.DATE_KEYWORDS):
+        if cls.DATE_PATTERN.search(query_lower):
             return 300.0  # 5 minutes
 
         # 5. Factual queries - long TTL
-        if any(keyword in query_lower for keyword in cls.FACTUAL_KEYWORDS):
+        if cls.FACTUAL_PATTERN.search(query_lower):
             return 3600.0  # 1 hour
 
         # 6. Questions that look factual - long TTL
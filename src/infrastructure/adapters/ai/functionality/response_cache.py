@@ -59,17 +59,24 @@ class ResponseCache:
         logger.info("response_cache_initialized",
                     max_size=max_size, enabled=enabled)
 
-    def _hash_query(self, query: str) -> str:
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize query (case-insensitive) - spočítej jednou a předávej dál"""
+        return query.lower().strip()
+
+    def _hash_query(self, query: str, normalized: Optional[str] = None) -> str:
         """Create hash of query (case-insensitive, normalized)"""
-        normalized = query.lower().strip()
+        if normalized is None:
+            normalized = self.normalize(query)
         return hashlib.md5(normalized.encode()).hexdigest()
 
-    def get(self, query: str) -> Optional[str]:
+    def get(self, query: str, normalized: Optional[str] = None) -> Optional[str]:
         """
         Get cached response if available and not expired.
 
         Args:
             query: User query
+            normalized: Already normalized query (see normalize())
 
         Returns:
             Cached response or None
@@ -77,7 +84,7 @@ class ResponseCache:
         if not self.enabled:
             return None
 
-        key = self._hash_query(query)
+        key = self._hash_query(query, normalized)
 
         if key not in self.cache:
             self.misses += 1
@@ -105,25 +112,29 @@ class ResponseCache:
 
         return entry.response
 
-    def set(self, query: str, response: str) -> None:
+    def set(self, query: str, response: str, normalized: Optional[str] = None) -> None:
         """
         Cache response with smart TTL.
 
         Args:
             query: User query
             response: AI response
+            normalized: Already normalized query (see normalize())
         """
         if not self.enabled:
             return
 
+        if normalized is None:
+            normalized = self.normalize(query)
+
         # Determine TTL
-        ttl = CacheTTLStrategy.get_ttl(query)
+        ttl = CacheTTLStrategy.get_ttl(query, normalized)
 
         if ttl == 0:
             logger.debug("cache_skip", query=query[:50], reason="ttl=0")
             return
 
-        key = self._hash_query(query)
+        key = self._hash_query(query, normalized)
 
         # Evict oldest if full
         if len(self.cache) >= self.max_size and key not in self.cache:
@@ -182,10 +182,13 @@ class HybridAIHandler(ICommandHandler):
 
         logger.info("request_received", query=text[:50])
 
+        # Normalizace jednou pro cache lookup, cache set i TTL strategii
+        normalized = self.cache.normalize(text)
+
         # ========================================
         # Phase 1: Cache Check
         # ========================================
-        cached_response = self.cache.get(text)
+        cached_response = self.cache.get(text, normalized)
         if cached_response:
             self.stats.cache_hits += 1
             logger.info("cache_hit_returned", query=text[:50])
@@ -195,7 +198,7 @@ class HybridAIHandler(ICommandHandler):
         # Phase 2: Routing Decision
         # ========================================
         try:
-            handler_choice = self._determine_handler(text)
+            handler_choice = self._determine_handler(text, normalized)
             logger.info("handler_selected", handler=handler_choice)
         except Exception as e:
             logger.error("routing_failed", error=str(e))
@@ -229,17 +232,21 @@ class HybridAIHandler(ICommandHandler):
         # Phase 4: Cache & Return
         # ========================================
         if response and metrics and metrics.success:
-            self.cache.set(text, response)
+            self.cache.set(text, response, normalized)
 
         # Update statistics
         self._update_statistics(metrics)
 
         return response
 
-    def _determine_handler(self, text: str) -> str:
+    def _determine_handler(self, text: str, normalized: Optional[str] = None) -> str:
         """
         Determine which handler to use.
 
+        Args:
+            text: User query
+            normalized: Query already normalized for the cache (reused by router)
+
         Priority:
         1. User preference override
         2. Circuit breaker state
@@ -273,7 +280,7 @@ class HybridAIHandler(ICommandHandler):
 
         # 3. Use intelligent router (handles PII, complexity, etc.)
         # FIX: router.route() returns tuple (decision, handler)
-        routing_decision, suggested_handler = self.router.route(text)
+        routing_decision, suggested_handler = self.router.route(text, text_lower=normalized)
 
         # 4. Adaptive routing override (if cloud is slow)
         if self.config.adaptive_routing and suggested_handler == "cloud":
@@ -9,6 +9,9 @@ from src.core.ports.i_audio_input import IAudioInput
 
 logger = structlog.get_logger()
 
+# Kolik chunků (po 80 ms) drží ring buffer, než se začnou zahazovat nejstarší
+AUDIO_RING_SLOTS = 32
+
 class SoundDeviceCapture(IAudioInput):
     """Audio capture implementation using sounddevice library"""
     
@@ -31,6 +34,21 @@ class SoundDeviceCapture(IAudioInput):
         self.device = device
         self.gain = gain
         self.stream = None
+
+        # SPSC ring buffer: PortAudio callback zapisuje (_write_idx),
+        # event loop čte (_read_idx) - předalokovaný, bez front a zámků
+        self._ring: Optional[np.ndarray] = None
+        self._write_idx = 0
+        self._read_idx = 0
+        self._overflow_count = 0
+        self._reported_overflows = 0
+        # Probuzení čtenáře - callback ho budí jen když opravdu čeká
+        self._data_ready: Optional[asyncio.Event] = None
+        self._reader_waiting = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # float32 scratch pro gain - násobení a clip proběhnou bez dočasných float64 polí
+        self._gain_scratch = np.empty(chunk_size * channels, dtype=np.float32)
         
         logger.info(
             "sounddevice_capture_initialized", 
@@ -41,15 +59,56 @@ class SoundDeviceCapture(IAudioInput):
             gain=gain
         )
     
-    def start_stream(self):
-        """Start continuous audio stream for wake word detection"""
+    def start_stream(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Start continuous audio stream for wake word detection.
+
+        Stream běží v callback režimu - PortAudio vlákno kopíruje chunky do
+        předalokovaného ring bufferu a read_chunk se probudí hned, jak chunk dorazí.
+
+        Idempotentní: běžící stream se vrátí znovu (otevření PortAudio streamu
+        je drahé a nový stream by zahodil rozpracovaný ring buffer).
+
+        Args:
+            loop: Event loop, ve kterém se budou číst chunky. Bez něj se použije
+                běžící loop - volání mimo běžící loop bez `loop` je chyba
+                (probuzení čtenáře by šla do loopu, který neběží).
+
+        Raises:
+            RuntimeError: Bez běžícího event loopu a bez `loop`
+        """
+        if self.stream is not None:
+            logger.debug("audio_stream_already_running")
+            return self.stream
+
         try:
-            self.stream = sd.InputStream(
+            # Loop, který bude číst chunky - callback do něj posílá probuzení
+            if loop is None:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    raise RuntimeError(
+                        "start_stream() needs a running event loop or an explicit loop argument"
+                    ) from None
+            self._loop = loop
+            # Nový vynulovaný ring - nic z předchozího streamu se nepřečte
+            self._ring = np.zeros(
+                (AUDIO_RING_SLOTS, self.chunk_size * self.channels), dtype=np.int16
+            )
+            self._write_idx = 0
+            self._read_idx = 0
+            self._overflow_count = 0
+            self._reported_overflows = 0
+            self._data_ready = asyncio.Event()
+            self._reader_waiting = False
+            # RawInputStream - sounddevice nevytváří numpy pole pro každý blok
+            self.stream = sd.RawInputStream(
                 device=self.device,
                 channels=self.channels,
                 samplerate=self.sample_rate,
                 blocksize=self.chunk_size,
-                dtype='int16'
+                dtype='int16',
+                callback=self._audio_callback
             )
             self.stream.start()
             logger.info("audio_stream_started")
@@ -58,33 +117,118 @@ class SoundDeviceCapture(IAudioInput):
             logger.error("failed_to_start_stream", error=str(e))
             raise
     
-    async def read_chunk(self, stream) -> np.ndarray:
-        """Read one chunk from the audio stream"""
+    def _audio_callback(self, indata, frames, time_info, status):
+        """PortAudio callback (audio vlákno) - jen kopie do ring bufferu, žádná alokace ani logování"""
+        if status.input_overflow:
+            self._overflow_count += 1
+
+        # indata je buffer PortAudia, po návratu z callbacku se přepíše - kopie do slotu
+        write_idx = self._write_idx
+        np.copyto(self._ring[write_idx % AUDIO_RING_SLOTS], np.frombuffer(indata, dtype=np.int16))
+        # Index se posune až po zápisu - čtenář nikdy nevidí rozepsaný slot
+        self._write_idx = write_idx + 1
+
+        if self._reader_waiting:
+            self._reader_waiting = False
+            try:
+                self._loop.call_soon_threadsafe(self._data_ready.set)
+            except RuntimeError:
+                # Event loop už je zavřený (ukončování aplikace)
+                pass
+
+    def _pending_count(self) -> int:
+        """Počet nepřečtených chunků v ring bufferu (jen z event loopu)"""
+        pending = self._write_idx - self._read_idx
+        if pending >= AUDIO_RING_SLOTS:
+            # Čtenář nestíhá - zahodí nejstarší; slot, do kterého callback
+            # zapisuje jako další, se přeskočí
+            dropped = pending - (AUDIO_RING_SLOTS - 1)
+            self._read_idx += dropped
+            pending -= dropped
+            logger.debug("audio_ring_full_dropping_oldest", dropped=dropped)
+
+        if self._overflow_count != self._reported_overflows:
+            self._reported_overflows = self._overflow_count
+            logger.warning("audio_buffer_overflow")
+
+        return pending
+
+    def _take_chunk(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Přečte nejstarší chunk z ringu (kopií nebo do `out`) a uvolní slot"""
+        chunk = self._apply_gain(self._ring[self._read_idx % AUDIO_RING_SLOTS], out)
+        self._read_idx += 1
+        return chunk
+
+    async def read_chunk(self, stream, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Read one chunk from the audio stream.
+
+        Pokud je předán `out` (int16 buffer o velikosti chunk_size), data se
+        zapíšou do něj a vrátí se stejný buffer - volající může buffery recyklovat.
+        """
         try:
-            # Read in a non-blocking way using asyncio
-            loop = asyncio.get_event_loop()
-            audio_data, overflowed = await loop.run_in_executor(
-                None, stream.read, self.chunk_size
-            )
-            
-            if overflowed:
-                logger.warning("audio_buffer_overflow")
-            
-            # Ensure it's flattened
-            audio_data = audio_data.flatten()
-            
-            # Apply gain
-            if self.gain != 1.0:
-                audio_data = np.clip(
-                    audio_data * self.gain, 
-                    -32768, 
-                    32767
-                ).astype(np.int16)
-            
-            return audio_data
+            # Čeká na další chunk z callbacku (bez pollingu a bez executoru).
+            # Příznak čekání se nastaví PŘED kontrolou ringu, aby se callback
+            # zapisující mezi kontrolou a await nezapomněl čtenáře probudit.
+            # stop_stream() čtenáře probudí - ring je pak None.
+            while True:
+                if self._ring is None:
+                    raise RuntimeError("Audio stream not started")
+                self._data_ready.clear()
+                self._reader_waiting = True
+                if self._pending_count():
+                    self._reader_waiting = False
+                    break
+                await self._data_ready.wait()
+
+            return self._take_chunk(out)
         except Exception as e:
             logger.error("read_chunk_error", error=str(e))
             raise
+
+    def read_pending_chunks(self, max_chunks: int, out: Optional[np.ndarray] = None) -> list:
+        """
+        Vrátí bez čekání až `max_chunks` chunků, které už čekají v ring bufferu.
+        Umožňuje volajícímu dohnat zpoždění zpracováním backlogu najednou.
+
+        Pokud je předán `out` (int16), chunky se zapíšou za sebou do něj
+        a vrátí se jako jeho view - bez alokace (nejvýš kolik se do `out` vejde).
+        """
+        if self._ring is None:
+            return []
+
+        count = min(self._pending_count(), max_chunks)
+        if out is None:
+            return [self._take_chunk() for _ in range(count)]
+
+        chunk_len = self._ring.shape[1]
+        count = min(count, out.size // chunk_len)
+        return [
+            self._take_chunk(out[i * chunk_len:(i + 1) * chunk_len])
+            for i in range(count)
+        ]
+
+    def _apply_gain(self, audio_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Zploští chunk a aplikuje gain (volitelně do předalokovaného `out`)"""
+        # Chunk je slot ring bufferu - výsledek musí být vždy vlastní kopie
+        audio_data = audio_data.reshape(-1)
+
+        if out is None:
+            out = np.empty(audio_data.size, dtype=np.int16)
+
+        if self.gain == 1.0:
+            np.copyto(out, audio_data)
+            return out
+
+        scratch = self._gain_scratch
+        if scratch.size != audio_data.size:
+            scratch = np.empty(audio_data.size, dtype=np.float32)
+
+        # multiply -> clip -> int16, vše do předalokovaných bufferů
+        np.multiply(audio_data, self.gain, out=scratch)
+        np.clip(scratch, -32768, 32767, out=scratch)
+        np.copyto(out, scratch, casting='unsafe')
+        return out
     
     async def record_command(self, duration: float = 5.0) -> np.ndarray:
         """Record audio after wake word is detected"""
@@ -95,7 +239,7 @@ class SoundDeviceCapture(IAudioInput):
             frames = int(duration * self.sample_rate)
             
             # Record audio
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             audio_data = await loop.run_in_executor(
                 None,
                 sd.rec,
@@ -110,13 +254,12 @@ class SoundDeviceCapture(IAudioInput):
             await loop.run_in_executor(None, sd.wait)
             
             # Apply gain
-            audio_data = audio_data.flatten()
+            audio_data = audio_data.reshape(-1)
             if self.gain != 1.0:
-                audio_data = np.clip(
-                    audio_data * self.gain, 
-                    -32768, 
-                    32767
-                ).astype(np.int16)
+                # Jedno float32 pole místo float64 mezivýsledků, clip in-place
+                scaled = np.multiply(audio_data, self.gain, dtype=np.float32)
+                np.clip(scaled, -32768, 32767, out=scaled)
+                audio_data = scaled.astype(np.int16)
             
             logger.info("recording_complete", frames=len(audio_data))
             return audio_data
@@ -127,10 +270,32 @@ class SoundDeviceCapture(IAudioInput):
     
     def stop_stream(self):
         """Stop the audio stream"""
-        if self.stream:
+        stream, self.stream = self.stream, None
+        if stream:
             try:
-                self.stream.stop()
-                self.stream.close()
+                stream.stop()
+                stream.close()
                 logger.info("audio_stream_stopped")
             except Exception as e:
                 logger.error("stop_stream_error", error=str(e))
+            finally:
+                self._reset_ring()
+
+    def _reset_ring(self) -> None:
+        """Zahoď ring buffer po zastavení streamu a probuď čekajícího čtenáře"""
+        # Po stream.stop() už callback neběží - ring lze bezpečně uvolnit
+        self._ring = None
+        self._write_idx = 0
+        self._read_idx = 0
+        self._overflow_count = 0
+        self._reported_overflows = 0
+
+        data_ready, self._data_ready = self._data_ready, None
+        if data_ready is not None and self._reader_waiting:
+            self._reader_waiting = False
+            # read_chunk se probudí, uvidí ring None a vyhodí "Audio stream not started"
+            try:
+                self._loop.call_soon_threadsafe(data_ready.set)
+            except RuntimeError:
+                # Event loop už je zavřený (ukončování aplikace)
+                pass
@@ -1,6 +1,6 @@
 # src/infrastructure/adapters/audio/vad/functionality/buffer_manager.py
 
-"""Efficient buffer management using deque."""
+"""Efficient buffer management using deque or a preallocated array."""
 
 from collections import deque
 from typing import Optional
@@ -16,21 +16,34 @@ class BufferManager:
 
     Používá deque pro O(1) append místo O(n) concatenate.
     Předchází zbytečným alokacím paměti.
+
+    S `max_samples` se samply zapisují rovnou do jednoho předalokovaného
+    pole (frame -> kopie na offset) - to_array() pak nic nespojuje.
     """
 
-    def __init__(self, max_size: Optional[int] = None):
+    def __init__(self, max_size: Optional[int] = None, max_samples: Optional[int] = None):
         """
         Args:
             max_size: Maximální počet framů (None = unlimited)
+            max_samples: Maximální počet samplů v bufferu (None = unlimited).
+                Při překročení se zahazují nejstarší framy (FIFO) - paměť
+                i cena přepisu jsou tak shora omezené bez ohledu na velikost framů.
         """
         self.buffer = deque(maxlen=max_size)
+        # Předalokovaný režim: délky framů (hranice) + souvislé úložiště
+        self._storage: Optional[np.ndarray] = None
+        self._frame_lengths: deque = deque()
         self.max_size = max_size
+        self.max_samples = max_samples
         self.frame_count = 0
         self.sample_count = 0
+        self.buffered_samples = 0
+        self._overflow_logged = False
 
         logger.debug(
             "buffer_manager_initialized",
-            max_size=max_size if max_size else "unlimited"
+            max_size=max_size if max_size else "unlimited",
+            max_samples=max_samples if max_samples else "unlimited"
         )
 
     def append(self, frame: np.ndarray) -> None:
@@ -40,15 +53,73 @@ class BufferManager:
         Args:
             frame: Audio frame (numpy array)
         """
+        if self.max_samples:
+            self._append_preallocated(frame.reshape(-1))
+            return
+
+        # Deque s maxlen při plném bufferu sám dropne nejstarší frame
+        if self.max_size and len(self.buffer) == self.max_size:
+            self.buffered_samples -= len(self.buffer[0])
+            self._log_overflow()
+
         self.buffer.append(frame)
         self.frame_count += 1
         self.sample_count += len(frame)
+        self.buffered_samples += len(frame)
+
+        # FIFO ořez na max_samples (poslední frame vždy zůstává)
+        if self.max_samples:
+            while self.buffered_samples > self.max_samples and len(self.buffer) > 1:
+                self.buffered_samples -= len(self.buffer.popleft())
+                self._log_overflow()
+
+    def _append_preallocated(self, frame: np.ndarray) -> None:
+        """Zkopíruj frame za poslední samply předalokovaného úložiště"""
+        length = len(frame)
+        if self._storage is None:
+            # Alokace až při prvním framu - dtype podle vstupu (typicky int16)
+            self._storage = np.empty(max(self.max_samples, length), dtype=frame.dtype)
+
+        # FIFO: zahoď nejstarší framy, dokud se nový nevejde (počet i samply)
+        drop_frames = 0
+        drop_samples = 0
+        remaining = len(self._frame_lengths)
+        while remaining - drop_frames > 0 and (
+            self.buffered_samples - drop_samples + length > self.max_samples
+            or (self.max_size and remaining - drop_frames >= self.max_size)
+        ):
+            drop_samples += self._frame_lengths[drop_frames]
+            drop_frames += 1
+
+        if drop_frames:
+            for _ in range(drop_frames):
+                self._frame_lengths.popleft()
+            kept = self.buffered_samples - drop_samples
+            # Posun zbytku na začátek (překryv řeší numpy) - jen na hraně limitu
+            self._storage[:kept] = self._storage[drop_samples:self.buffered_samples]
+            self.buffered_samples = kept
+            self._log_overflow()
+
+        end = self.buffered_samples + length
+        if end > len(self._storage):
+            # Jediný frame větší než limit - úložiště se zvětší (poslední frame vždy zůstává)
+            grown = np.empty(end, dtype=self._storage.dtype)
+            grown[:self.buffered_samples] = self._storage[:self.buffered_samples]
+            self._storage = grown
+        self._storage[self.buffered_samples:end] = frame
+        self._frame_lengths.append(length)
+        self.buffered_samples = end
+        self.frame_count += 1
+        self.sample_count += length
 
-        # Warning pokud přetečeme maxlen (deque automaticky dropne nejstarší)
-        if self.max_size and len(self.buffer) == self.max_size:
+    def _log_overflow(self) -> None:
+        """Warning při prvním zahození framu (ne při každém dalším appendu)"""
+        if not self._overflow_logged:
+            self._overflow_logged = True
             logger.warning(
                 "buffer_overflow",
                 max_size=self.max_size,
+                max_samples=self.max_samples,
                 message="Oldest frames are being dropped"
             )
 
@@ -56,9 +127,18 @@ class BufferManager:
         """
         Konvertuj buffer na numpy array (single concatenate operation).
 
+        V předalokovaném režimu vrací view úložiště (platné do dalšího
+        append/clear) - bez kopie.
+
         Returns:
             Concatenated numpy array
         """
+        if self.max_samples:
+            if not self._frame_lengths:
+                logger.debug("buffer_empty_returning_empty_array")
+                return np.array([], dtype=np.int16)
+            return self._storage[:self.buffered_samples]
+
         if not self.buffer:
             logger.debug("buffer_empty_returning_empty_array")
             return np.array([], dtype=np.int16)
@@ -78,8 +158,11 @@ class BufferManager:
     def clear(self) -> None:
         """Vyčisti buffer a resetuj countery."""
         self.buffer.clear()
+        self._frame_lengths.clear()
         self.frame_count = 0
         self.sample_count = 0
+        self.buffered_samples = 0
+        self._overflow_logged = False
         logger.debug("buffer_cleared")
 
     def get_last_n_frames(self, n: int) -> list:
@@ -92,6 +175,16 @@ class BufferManager:
         Returns:
             List posledních N framů
         """
+        if self.max_samples:
+            lengths = list(self._frame_lengths)[-n:]
+            frames = []
+            end = self.buffered_samples
+            for length in reversed(lengths):
+                frames.append(self._storage[end - length:end])
+                end -= length
+            frames.reverse()
+            return frames
+
         if n >= len(self.buffer):
             return list(self.buffer)
 
@@ -100,19 +193,23 @@ class BufferManager:
 
     def __len__(self) -> int:
         """Počet framů v bufferu."""
+        if self.max_samples:
+            return len(self._frame_lengths)
         return len(self.buffer)
 
     @property
     def is_empty(self) -> bool:
         """Je buffer prázdný?"""
-        return len(self.buffer) == 0
+        return len(self) == 0
 
     @property
     def is_full(self) -> bool:
-        """Je buffer plný (dosáhl max_size)?"""
+        """Je buffer plný (dosáhl max_size nebo max_samples)?"""
+        if self.max_samples is not None and self.buffered_samples >= self.max_samples:
+            return True
         if self.max_size is None:
             return False
-        return len(self.buffer) >= self.max_size
+        return len(self) >= self.max_size
 
     def duration_seconds(self, sample_rate: int = 16000) -> float:
         """
@@ -134,9 +231,11 @@ class BufferManager:
             Dictionary se statistikami
         """
         return {
-            'frames': len(self.buffer),
+            'frames': len(self),
             'samples': self.sample_count,
+            'buffered_samples': self.buffered_samples,
             'max_size': self.max_size,
+            'max_samples': self.max_samples,
             'is_full': self.is_full,
             'frame_count_total': self.frame_count  # Včetně droppnutých
         }
@@ -69,6 +69,8 @@ class VADRecorder:
         self.last_metrics: Optional[RecordingMetrics] = None
         self._is_recording = False
         self._current_tracker: Optional[MetricsTracker] = None
+        # Sdílený stream (wake word) se po nahrávání nezavírá
+        self._owns_stream = False
 
         # Double-threshold VAD parameters with SAFE defaults (higher for noise rejection)
         self.high_threshold = 1200.0  # Start speech (higher = less background noise)
@@ -77,6 +79,16 @@ class VADRecorder:
         self.smoothing_factor = 0.25  # Smoothing rate (0.25 = stable)
         self.calibrated = False  # Calibration flag
 
+        # float32 scratch pro volume/energy - jedna konverze snímku, bez alokace
+        self._frame_scratch = np.empty(0, dtype=np.float32)
+
+        # Recyklovaný int16 buffer pro čtení framů - BufferManager si data kopíruje
+        chunk_size = getattr(audio_input, 'chunk_size', None)
+        self._frame_buffer: Optional[np.ndarray] = (
+            np.empty(chunk_size * getattr(audio_input, 'channels', 1), dtype=np.int16)
+            if chunk_size else None
+        )
+
         logger.info(
             "vad_recorder_initialized",
             config=self.config.to_dict(),
@@ -88,15 +100,18 @@ class VADRecorder:
         """Context manager entry."""
         if not self.stream:
             self.stream = self.audio_input.start_stream()
+            self._owns_stream = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - cleanup."""
-        if self.stream:
+        """Context manager exit - cleanup (jen stream, který recorder sám otevřel)."""
+        if self.stream and self._owns_stream:
             try:
-                self.stream.stop()
+                self.audio_input.stop_stream()
             except Exception as e:
                 logger.warning("stream_stop_error", error=str(e))
+            self.stream = None
+            self._owns_stream = False
         return False
 
     @property
@@ -116,16 +131,42 @@ class VADRecorder:
         Better than mean for speech detection.
         """
         if frame.dtype == np.int16:
-            frame_float = frame.astype(np.float32)
+            frame_float = frame.astype(np.float32).ravel()
         else:
-            frame_float = frame
+            frame_float = frame.ravel()
+
+        if frame_float.size == 0:
+            return 0.0
+
+        # Skalární součin = suma čtverců v jednom BLAS průchodu (bez dočasného pole)
+        return float(np.sqrt(np.dot(frame_float, frame_float) / frame_float.size))
+
+    def _frame_volume_and_energy(self, frame: np.ndarray) -> tuple[float, float]:
+        """
+        Mean absolute volume a RMS energie jedním převodem snímku do float32.
 
-        return float(np.sqrt(np.mean(frame_float ** 2)))
+        |x| nemění x*x, takže obojí se spočítá z téhož (in-place abs) bufferu.
+        Ve float32 navíc nepřeteče abs(-32768) jako v int16.
+        """
+        frame = frame.ravel()
+        if frame.size == 0:
+            return 0.0, 0.0
+
+        scratch = self._frame_scratch
+        if scratch.size != frame.size:
+            scratch = self._frame_scratch = np.empty(frame.size, dtype=np.float32)
+
+        np.copyto(scratch, frame, casting='unsafe')
+        np.abs(scratch, out=scratch)
+        volume = float(scratch.mean())
+        energy = float(np.sqrt(np.dot(scratch, scratch) / scratch.size))
+        return volume, energy
 
     def _double_threshold_vad(
             self,
             frame: np.ndarray,
-            speech_active: bool
+            speech_active: bool,
+            energy: Optional[float] = None
     ) -> tuple[bool, float]:
         """
         Double-threshold VAD with hysteresis (Google/Alexa style).
@@ -133,12 +174,14 @@ class VADRecorder:
         Args:
             frame: Audio frame
             speech_active: Is speech currently active?
+            energy: Precomputed RMS energy of the frame (optional)
 
         Returns:
             (is_speech, energy)
         """
         # Calculate RMS energy
-        energy = self._calculate_rms_energy(frame)
+        if energy is None:
+            energy = self._calculate_rms_energy(frame)
 
         # Exponential smoothing for stability
         self.smoothed_energy = (
@@ -156,6 +199,21 @@ class VADRecorder:
 
         return is_speech, self.smoothed_energy
 
+    @staticmethod
+    def _frame_energies(audio: np.ndarray, frame_size: int) -> np.ndarray:
+        """
+        RMS energie pro každý frame v jednom vektorizovaném průchodu.
+
+        Args:
+            audio: Audio array (délka musí být násobkem frame_size)
+            frame_size: Velikost framu v samplech
+
+        Returns:
+            Array RMS energií (jedna hodnota na frame)
+        """
+        frames = audio.reshape(-1, frame_size).astype(np.float32)
+        return np.sqrt(np.mean(frames * frames, axis=1))
+
     def _trim_silence(self, audio: np.ndarray, threshold: float = 500.0) -> np.ndarray:
         """
         Odstřihni ticho ze začátku a konce nahrávky.
@@ -168,31 +226,29 @@ class VADRecorder:
         Returns:
             Trimmed audio array
         """
-        if len(audio) == 0:
-            return audio
-
         # Frame size
         frame_size = self.config.frame_size
+        n_frames = (len(audio) - 1) // frame_size
+        if n_frames <= 0:
+            return audio
+
+        # Energie všech framů najednou - jeden reshape místo slicování po framech.
+        # Začátek je zarovnaný od 0, konec od posledního samplu.
+        head_energies = self._frame_energies(audio[:n_frames * frame_size], frame_size)
+        tail_offset = len(audio) - n_frames * frame_size
+        tail_energies = self._frame_energies(audio[tail_offset:], frame_size)
 
         # Najdi první speech frame (od začátku)
         start_idx = 0
-        for i in range(0, len(audio) - frame_size, frame_size):
-            frame = audio[i:i + frame_size]
-            energy = float(np.sqrt(np.mean(frame.astype(np.float32) ** 2)))
-            if energy > threshold:
-                start_idx = max(0, i - frame_size * 2)  # Keep 2 frames before
-                break
+        speech = np.flatnonzero(head_energies > threshold)
+        if speech.size:
+            start_idx = max(0, (int(speech[0]) - 2) * frame_size)  # Keep 2 frames before
 
         # Najdi poslední speech frame (od konce)
         end_idx = len(audio)
-        for i in range(len(audio) - frame_size, 0, -frame_size):
-            if i + frame_size > len(audio):
-                continue
-            frame = audio[i:i + frame_size]
-            energy = float(np.sqrt(np.mean(frame.astype(np.float32) ** 2)))
-            if energy > threshold:
-                end_idx = min(len(audio), i + frame_size * 3)  # Keep 3 frames after
-                break
+        speech = np.flatnonzero(tail_energies > threshold)
+        if speech.size:
+            end_idx = min(len(audio), tail_offset + (int(speech[-1]) + 3) * frame_size)  # Keep 3 frames after
 
         # Ensure we have valid indices
         if start_idx >= end_idx or start_idx >= len(audio):
@@ -201,10 +257,16 @@ class VADRecorder:
         return audio[start_idx:end_idx]
 
     async def _read_frame(self) -> np.ndarray:
-        """Helper metoda pro čtení framu."""
+        """
+        Helper metoda pro čtení framu.
+
+        Frame je recyklovaný buffer - platí jen do dalšího čtení.
+        """
         if not self.stream:
             raise RuntimeError("Stream not initialized")
 
+        if self._frame_buffer is not None:
+            return await self.audio_input.read_chunk(self.stream, out=self._frame_buffer)
         return await self.audio_input.read_chunk(self.stream)
 
     async def calibrate_background(
@@ -314,19 +376,21 @@ class VADRecorder:
         - Post-processing: Trim silence from start/end
         """
         # Initialize modules
-        buffer = BufferManager(max_size=self.config.max_frames)
+        # Limit v samplech - max_frames počítá s 30ms framy, chunky ze
+        # vstupu jsou ale 1280 samplů (80 ms)
+        max_dur = max_duration or self.config.max_duration
+        buffer = BufferManager(
+            max_samples=int(max_dur * self.config.sample_rate)
+        )
         tracker = MetricsTracker()
         self._current_tracker = tracker
         self._is_recording = True
 
-        # Config
-        max_dur = max_duration or self.config.max_duration
-
         # ULTRA-FAST adaptive silence thresholds
         trailing_silence_frames = 10  # 0.3s @ 30ms frames (ultra-fast!)
         initial_silence_frames = 33  # 1.0s @ 30ms frames (prevent false starts)
 
-        # Start stream if needed
+        # Start stream if needed (běžící stream se sdílí - žádné nové otevření zařízení)
         if not self.stream:
             self.stream = self.audio_input.start_stream()
 
@@ -375,11 +439,13 @@ class VADRecorder:
                     stop_reason = "error"
                     break
 
-                # Extract volume for metrics
-                volume = float(np.abs(frame).mean())
+                # Extract volume for metrics (+ RMS energy z téhož průchodu)
+                volume, frame_energy = self._frame_volume_and_energy(frame)
 
                 # Double-threshold VAD (the core logic)
-                is_speech, energy = self._double_threshold_vad(frame, speech_started)
+                is_speech, energy = self._double_threshold_vad(
+                    frame, speech_started, frame_energy
+                )
 
                 # Update metrics (forced OK for production)
                 proximity_ok = True
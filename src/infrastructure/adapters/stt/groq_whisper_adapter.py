@@ -143,7 +143,7 @@ class GroqWhisperAdapter(ISTTEngine):
             logger.info("groq_transcribing", size=len(audio_data))
 
             # Spusť sync transcribe v executoru (neblocků async loop)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             text = await loop.run_in_executor(
                 None,
                 self._transcribe_with_retry,
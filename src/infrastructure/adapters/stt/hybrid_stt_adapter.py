@@ -52,6 +52,10 @@ class HybridSTTAdapter(ISTTEngine):
                    primary="groq" if self.groq_enabled else "local_whisper",
                    fallback="local_whisper")
 
+    async def warmup(self) -> None:
+        """Zahřej lokální Whisper (Groq běží vzdáleně, warmup nepotřebuje)."""
+        await self.fallback.warmup()
+
     async def transcribe(self, audio_data: bytes) -> str:
         """
         Transcribe s fallback strategií.
@@ -68,7 +72,7 @@ class HybridSTTAdapter(ISTTEngine):
                 logger.info("trying_groq_stt")
                 text = await self.primary.transcribe(audio_data)
 
-                if text and len(text.strip()) > 0:
+                if text and not text.isspace():
                     logger.info("groq_stt_success", length=len(text))
                     return text
                 else:
@@ -84,7 +88,7 @@ class HybridSTTAdapter(ISTTEngine):
             logger.info("using_local_whisper_fallback")
             text = await self.fallback.transcribe(audio_data)
 
-            if text and len(text.strip()) > 0:
+            if text and not text.isspace():
                 logger.info("local_whisper_success", length=len(text))
                 return text
             else:
@@ -19,6 +19,18 @@ IS_APPLE_SILICON = (
     sys.platform == "darwin"
 )
 
+# int16 PCM -> float32 [-1, 1)
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _to_float32(audio_data: np.ndarray) -> np.ndarray:
+    """Převod pro Whisper - int16 jedním průchodem (násobení rovnou do float32)"""
+    if audio_data.dtype == np.int16:
+        return np.multiply(audio_data, INT16_SCALE, dtype=np.float32)
+    if audio_data.dtype != np.float32:
+        return audio_data.astype(np.float32)
+    return audio_data
+
 
 class WhisperAdapter(ISTTEngine):
     """Speech-to-text using Whisper (MLX on M1, faster-whisper on others)"""
@@ -41,9 +53,13 @@ class WhisperAdapter(ISTTEngine):
         if user_config:
             self.beam_size = user_config.get('audio.stt.whisper_beam_size', 1)
             self.vad_filter = user_config.get('audio.stt.whisper_vad_filter', True)
+            self.compute_type = user_config.get('audio.stt.whisper_compute_type', 'int8')
+            self.num_workers = user_config.get('audio.stt.whisper_num_workers', 1)
         else:
             self.beam_size = 1
             self.vad_filter = True
+            self.compute_type = "int8"
+            self.num_workers = 1
 
         # Load appropriate backend based on platform
         if IS_APPLE_SILICON:
@@ -79,10 +95,13 @@ class WhisperAdapter(ISTTEngine):
             self.model = WhisperModel(
                 self.model_size,
                 device="cpu",
-                compute_type="int8"
+                compute_type=self.compute_type,
+                num_workers=self.num_workers
             )
             self.backend = "faster-whisper"
-            logger.info("faster_whisper_initialized")
+            logger.info("faster_whisper_initialized",
+                        compute_type=self.compute_type,
+                        num_workers=self.num_workers)
         except ImportError:
             logger.error("faster_whisper_not_installed")
             raise ImportError("Install faster-whisper: pip install faster-whisper")
@@ -98,12 +117,11 @@ class WhisperAdapter(ISTTEngine):
             Transcribed text
         """
         try:
-            # Convert to float32 if needed (both backends expect this)
-            if audio_data.dtype == np.int16:
-                audio_data = audio_data.astype(np.float32) / 32768.0
+            # Převod na float32 (oba backendy ho očekávají) proběhne
+            # v _transcribe_* až v executoru - mimo event loop
 
             # Run transcription in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             if self.backend == "mlx":
                 result = await loop.run_in_executor(
@@ -129,10 +147,39 @@ class WhisperAdapter(ISTTEngine):
                         error_type=type(e).__name__)
             raise STTError(f"Whisper transcription failed: {e}") from e
 
+    async def warmup(self) -> None:
+        """
+        Zahřej model přepisem 1 s ticha (výsledek se zahodí).
+        První inference je kvůli načtení vah a alokacím výrazně pomalejší.
+        """
+        silence = np.zeros(16000, dtype=np.float32)
+
+        try:
+            loop = asyncio.get_running_loop()
+            if self.backend == "mlx":
+                await loop.run_in_executor(None, self._transcribe_mlx, silence)
+            else:
+                await loop.run_in_executor(None, self._warmup_faster, silence)
+            logger.info("whisper_warmup_complete", backend=self.backend)
+        except Exception as e:
+            logger.warning("whisper_warmup_failed", error=str(e))
+
+    def _warmup_faster(self, audio_data: np.ndarray) -> None:
+        """Warmup pro faster-whisper - bez VAD filtru, jinak by se ticho zahodilo"""
+        segments, _ = self.model.transcribe(
+            audio_data,
+            language=self.language,
+            beam_size=self.beam_size,
+            vad_filter=False
+        )
+        # Segmenty jsou generátor - dekódování proběhne až při iteraci
+        for _ in segments:
+            pass
+
     def _transcribe_mlx(self, audio_data: np.ndarray) -> str:
         """Transcribe using MLX Whisper"""
         result = self.mlx_whisper.transcribe(
-            audio_data,
+            _to_float32(audio_data),
             path_or_hf_repo=self.model_path,
             language=self.language
         )
@@ -141,7 +188,7 @@ class WhisperAdapter(ISTTEngine):
     def _transcribe_faster(self, audio_data: np.ndarray) -> str:
         """Transcribe using faster-whisper"""
         segments, _ = self.model.transcribe(
-            audio_data,
+            _to_float32(audio_data),
             language=self.language,
             beam_size=self.beam_size,
             vad_filter=self.vad_filter,
@@ -70,7 +70,8 @@ class OpenWakeWordAdapter(IWakeWordDetector):
         Detect wake word in audio chunk
 
         Args:
-            audio_chunk: Audio data (int16 format, 1280 samples)
+            audio_chunk: Audio data (int16 format, 1280 samples or a multiple -
+                OpenWakeWord then evaluates all 80 ms frames in one call)
 
         Returns:
             True if wake word detected, False otherwise
@@ -94,8 +95,8 @@ class OpenWakeWordAdapter(IWakeWordDetector):
             if len(audio_chunk.shape) > 1:
                 audio_chunk = audio_chunk.flatten()
 
-            # Check chunk size
-            if len(audio_chunk) != 1280:
+            # Check chunk size (násobek 1280 samplů)
+            if len(audio_chunk) == 0 or len(audio_chunk) % 1280:
                 return False
 
             # Get predictions
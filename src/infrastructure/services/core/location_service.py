@@ -2,16 +2,35 @@
 Location Service - Auto-detects or manually configures user location
 """
 
+import asyncio
+import functools
+import json
+import os
 import structlog
+import threading
+from pathlib import Path
 from typing import Dict, Optional
 import geocoder
+import requests
 from timezonefinder import TimezoneFinder
 from geopy.geocoders import Nominatim
-import pytz
 from datetime import datetime
 
 logger = structlog.get_logger()
 
+# Detekovaná lokace přežije restart - během TTL se nevolá síť vůbec
+LOCATION_CACHE_FILE = Path.home() / ".cache" / "voice-assistant" / "location.json"
+
+# Klíče, které musí mít lokace z disk cache (čte je context builder i get_timezone)
+REQUIRED_LOCATION_KEYS = ('city', 'country', 'timezone')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_timezone_finder() -> TimezoneFinder:
+    """Sdílená TimezoneFinder instance - konstruktor načítá několik MB dat, vytvoř ji jen jednou a až při potřebě"""
+    logger.debug("timezone_finder_loading")
+    return TimezoneFinder()
+
 
 class LocationService:
     """
@@ -24,15 +43,32 @@ class LocationService:
     - Caching for performance
     """
 
-    def __init__(self):
-        """Initialize location service"""
+    def __init__(self, cache_file: Optional[Path] = LOCATION_CACHE_FILE):
+        """
+        Initialize location service
+
+        Args:
+            cache_file: Soubor pro perzistentní cache lokace (None = jen v paměti)
+        """
         self.geolocator = Nominatim(user_agent="voice-assistant")
-        self.timezone_finder = TimezoneFinder()
+        # Sdílená HTTP session - geocoder jinak otevírá nové TCP+TLS spojení při každé detekci
+        self._session = requests.Session()
         self._cached_location: Optional[Dict] = None
         self._cache_timestamp: Optional[datetime] = None
         self._cache_duration_hours = 1
+        # Mezi TTL a stale limitem se vrací stará lokace a obnova běží na pozadí
+        self._stale_duration_hours = 24
+        self._cache_lock = threading.Lock()
+        self._refreshing = False
+        self._cache_file = Path(cache_file) if cache_file else None
+        self._load_disk_cache()
         logger.debug("location_service_initialized")
 
+    @property
+    def timezone_finder(self) -> TimezoneFinder:
+        """Lazy, sdílená TimezoneFinder instance (načte se až při první detekci)"""
+        return _get_timezone_finder()
+
     def get_current_location(self) -> Dict:
         """
         Get current location (auto-detect or cached).
@@ -45,6 +81,13 @@ class LocationService:
             logger.debug("location_cache_hit")
             return self._cached_location
 
+        # Stale-while-revalidate: prošlá (ale ne příliš stará) lokace se vrátí
+        # hned a detekce proběhne na pozadí
+        if self._is_cache_stale_usable():
+            self._start_background_refresh()
+            logger.debug("location_cache_stale_hit")
+            return self._cached_location
+
         # Auto-detect
         try:
             location = self._detect_location()
@@ -55,6 +98,12 @@ class LocationService:
             logger.error("location_detection_failed", error=str(e))
             return self._get_fallback_location()
 
+    async def get_current_location_async(self) -> Dict:
+        """Async varianta get_current_location - síťová detekce neblokuje event loop"""
+        if self._is_cache_valid():
+            return self._cached_location
+        return await asyncio.to_thread(self.get_current_location)
+
     def get_timezone(self, user_config) -> str:
         """
         Get timezone based on configuration.
@@ -95,7 +144,7 @@ class LocationService:
         """
         try:
             # Get location from IP
-            g = geocoder.ip('me')
+            g = geocoder.ip('me', session=self._session)
 
             if not g.ok:
                 raise Exception("IP geolocation failed")
@@ -173,12 +222,99 @@ class LocationService:
 
         return is_valid
 
+    def _is_cache_stale_usable(self) -> bool:
+        """Je prošlá cache ještě použitelná pro stale-while-revalidate?"""
+        location, timestamp = self._cached_location, self._cache_timestamp
+        if not location or not timestamp:
+            return False
+
+        age_hours = (datetime.now() - timestamp).total_seconds() / 3600
+        return age_hours < self._stale_duration_hours
+
+    def _start_background_refresh(self) -> None:
+        """Spusť detekci lokace v daemon vlákně (nejvýš jedna najednou)"""
+        with self._cache_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        try:
+            threading.Thread(
+                target=self._refresh_in_background,
+                name="location-refresh",
+                daemon=True
+            ).start()
+        except Exception:
+            with self._cache_lock:
+                self._refreshing = False
+            raise
+
+    def _refresh_in_background(self) -> None:
+        """Obnov cache na pozadí; při chybě zůstává stará lokace"""
+        try:
+            location = self._detect_location()
+            self._update_cache(location)
+            logger.info("location_refreshed", city=location['city'], country=location['country'])
+        except Exception as e:
+            logger.warning("location_background_refresh_failed", error=str(e))
+        finally:
+            # Pod stejným zámkem jako kontrola v _start_background_refresh
+            with self._cache_lock:
+                self._refreshing = False
+
     def _update_cache(self, location: Dict) -> None:
         """Update location cache"""
-        self._cached_location = location
-        self._cache_timestamp = datetime.now()
+        with self._cache_lock:
+            self._cached_location = location
+            self._cache_timestamp = datetime.now()
+            self._save_disk_cache()
         logger.debug("location_cache_updated")
 
+    def _load_disk_cache(self) -> None:
+        """Načti lokaci uloženou předchozím během (platnost hlídá _is_cache_valid)"""
+        if not self._cache_file:
+            return
+
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            # Poškozený/neúplný soubor se ignoruje - lokace se pak detekuje znovu
+            location = data.get('location') if isinstance(data, dict) else None
+            timestamp = data.get('timestamp') if isinstance(data, dict) else None
+            if not isinstance(location, dict) or not all(
+                isinstance(location.get(key), str) and location.get(key)
+                for key in REQUIRED_LOCATION_KEYS
+            ):
+                raise ValueError("location is missing required keys")
+            if not isinstance(timestamp, (int, float)) or isinstance(timestamp, bool):
+                raise ValueError("timestamp is not a number")
+
+            self._cached_location = location
+            self._cache_timestamp = datetime.fromtimestamp(timestamp)
+            logger.debug("location_disk_cache_loaded", path=str(self._cache_file))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("location_disk_cache_invalid", error=str(e))
+
+    def _save_disk_cache(self) -> None:
+        """Ulož lokaci na disk (atomicky přes dočasný soubor)"""
+        if not self._cache_file:
+            return
+
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_file.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'timestamp': self._cache_timestamp.timestamp(),
+                    'location': self._cached_location
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, self._cache_file)
+        except Exception as e:
+            logger.warning("location_disk_cache_save_failed", error=str(e))
+
     def _get_fallback_location(self) -> Dict:
         """Get fallback location when detection fails"""
         fallback = {
@@ -198,6 +334,11 @@ class LocationService:
         """Clear location cache"""
         self._cached_location = None
         self._cache_timestamp = None
+        if self._cache_file:
+            try:
+                self._cache_file.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("location_disk_cache_delete_failed", error=str(e))
         logger.debug("location_cache_cleared")
 
     def get_location_summary(self) -> str:
@@ -3,8 +3,9 @@ Time Service - Správa času s ohledem na timezone
 """
 
 import structlog
+import time
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 # Podpora pro Python 3.9+
 try:
@@ -14,6 +15,13 @@ except ImportError:
 
 logger = structlog.get_logger()
 
+# Názvy dnů a měsíců - tuple na úrovni modulu, nevytváří se při každém volání
+DAY_NAMES = ('Pondělí', 'Úterý', 'Středa', 'Čtvrtek', 'Pátek', 'Sobota', 'Neděle')
+MONTH_NAMES = (
+    'ledna', 'února', 'března', 'dubna', 'května', 'června',
+    'července', 'srpna', 'září', 'října', 'listopadu', 'prosince'
+)
+
 class TimeService:
     """Služba pro práci s časem podle timezone"""
 
@@ -32,6 +40,11 @@ class TimeService:
             self.timezone = ZoneInfo("UTC")
             self.timezone_name = "UTC"
 
+        # Memoizace get_time_context: (unix minuta, kontext)
+        self._context_cache: Optional[Tuple[int, Dict[str, str]]] = None
+        # Předformátované řetězce: (kontext, ze kterého vznikly, řetězce)
+        self._strings_cache: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None
+
     def get_current_datetime(self) -> datetime:
         """
         Získej aktuální čas v nastaveném timezone.
@@ -45,39 +58,74 @@ class TimeService:
         """
         Získej formátovaný datum a čas v češtině.
 
+        Sdílí cache s get_time_context - žádné další datetime.now().
+
         Returns:
             Formátovaný string (např. "Sobota, 11. 10. 2025, 22:49")
         """
-        now = self.get_current_datetime()
-
-        day_names = ['Pondělí', 'Úterý', 'Středa', 'Čtvrtek', 'Pátek', 'Sobota', 'Neděle']
-        day_name = day_names[now.weekday()]
-
-        return f"{day_name}, {now.day}. {now.month}. {now.year}, {now.hour:02d}:{now.minute:02d}"
+        return self.get_time_context()['formatted']
 
     def get_time_context(self) -> Dict[str, str]:
         """
         Získej slovník s časovými informacemi.
 
+        Výsledek se cachuje na aktuální minutu (jemnější údaje kontext
+        neobsahuje) - opakovaná volání v rámci jedné minuty vrací stejný
+        (needitovat!) slovník.
+
         Returns:
             Slovník s časovými údaji
         """
+        minute = int(time.time()) // 60
+        cached = self._context_cache
+        if cached is not None and cached[0] == minute:
+            return cached[1]
+
+        context = self._build_time_context()
+        self._context_cache = (minute, context)
+        return context
+
+    def get_formatted_strings(self) -> Dict[str, str]:
+        """
+        Získej předformátované řetězce pro rychlé odpovědi.
+
+        Cachují se spolu s get_time_context (na minutu).
+
+        Returns:
+            {'clock': "HH:MM", 'date': "D. měsíce YYYY", 'day': "Pondělí"}
+        """
+        context = self.get_time_context()
+        cached = self._strings_cache
+        if cached is not None and cached[0] is context:
+            return cached[1]
+
+        strings = {
+            'clock': f"{context['hour']}:{context['minute']}",
+            'date': f"{context['day']}. {context['month_name']} {context['year']}",
+            'day': context['day_name']
+        }
+        self._strings_cache = (context, strings)
+        return strings
+
+    def _build_time_context(self) -> Dict[str, str]:
+        """Sestaví časový kontext pro aktuální okamžik (jedno datetime.now())"""
         now = self.get_current_datetime()
 
-        day_names = ['Pondělí', 'Úterý', 'Středa', 'Čtvrtek', 'Pátek', 'Sobota', 'Neděle']
-        month_names = [
-            'ledna', 'února', 'března', 'dubna', 'května', 'června',
-            'července', 'srpna', 'září', 'října', 'listopadu', 'prosince'
-        ]
+        day_name = DAY_NAMES[now.weekday()]
+        day = str(now.day)
+        month = str(now.month)
+        year = str(now.year)
+        hour = f"{now.hour:02d}"
+        minute = f"{now.minute:02d}"
 
         return {
-            'formatted': self.get_formatted_datetime(),
-            'day_name': day_names[now.weekday()],
-            'day': str(now.day),
-            'month': str(now.month),
-            'month_name': month_names[now.month - 1],
-            'year': str(now.year),
-            'hour': f"{now.hour:02d}",
-            'minute': f"{now.minute:02d}",
+            'formatted': f"{day_name}, {day}. {month}. {year}, {hour}:{minute}",
+            'day_name': day_name,
+            'day': day,
+            'month': month,
+            'month_name': MONTH_NAMES[now.month - 1],
+            'year': year,
+            'hour': hour,
+            'minute': minute,
             'timezone': self.timezone_name
         }
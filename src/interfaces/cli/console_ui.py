@@ -76,7 +76,7 @@ class ConsoleUI:
         command_text = await self.orchestrator.capture_command()
 
         # 4. VALIDATE
-        if not command_text or len(command_text.strip()) == 0:
+        if not command_text or command_text.isspace():
             print("❌ No speech detected\n")
             print("─"*60 + "\n")
             await asyncio.sleep(1)
@@ -91,7 +91,7 @@ class ConsoleUI:
             print(f"🤖 {self.assistant_name}: ", end="", flush=True)
 
             # Process (streaming callback will print chunks)
-            response = self.orchestrator.process_command(command_text)
+            response = await self.orchestrator.process_command_async(command_text)
 
             # Response already printed via callback
             print("\n" + "─"*60 + "\n")
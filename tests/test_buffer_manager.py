@@ -0,0 +1,74 @@
+"""Tests for VAD BufferManager"""
+import pytest
+import numpy as np
+
+# Balíček vad importuje VADRecorder -> sounddevice
+pytest.importorskip("sounddevice")
+
+from src.infrastructure.adapters.audio.vad.functionality.buffer_manager import BufferManager
+
+
+def frame(value, length=4):
+    return np.full(length, value, dtype=np.int16)
+
+
+def test_deque_mode_concatenates_frames():
+    buffer = BufferManager()
+    buffer.append(frame(1))
+    buffer.append(frame(2))
+
+    assert len(buffer) == 2
+    assert buffer.to_array().tolist() == [1] * 4 + [2] * 4
+
+
+def test_preallocated_mode_keeps_frames_in_order():
+    buffer = BufferManager(max_samples=16)
+    for value in range(3):
+        buffer.append(frame(value))
+
+    assert len(buffer) == 3
+    assert buffer.buffered_samples == 12
+    assert buffer.to_array().tolist() == [0] * 4 + [1] * 4 + [2] * 4
+    assert [f[0] for f in buffer.get_last_n_frames(2)] == [1, 2]
+
+
+def test_preallocated_mode_drops_oldest_frames():
+    buffer = BufferManager(max_samples=8)
+    for value in range(4):
+        buffer.append(frame(value))
+
+    assert len(buffer) == 2
+    assert buffer.is_full
+    assert buffer.to_array().tolist() == [2] * 4 + [3] * 4
+    # sample_count/frame_count počítají i zahozené framy
+    assert buffer.frame_count == 4
+    assert buffer.sample_count == 16
+
+
+def test_preallocated_mode_respects_max_size():
+    buffer = BufferManager(max_size=2, max_samples=100)
+    for value in range(3):
+        buffer.append(frame(value))
+
+    assert len(buffer) == 2
+    assert buffer.to_array().tolist() == [1] * 4 + [2] * 4
+
+
+def test_preallocated_mode_keeps_oversized_frame():
+    buffer = BufferManager(max_samples=4)
+    buffer.append(frame(1))
+    buffer.append(frame(2, length=10))
+
+    assert len(buffer) == 1
+    assert buffer.to_array().tolist() == [2] * 10
+
+
+def test_clear_resets_buffer():
+    buffer = BufferManager(max_samples=8)
+    buffer.append(frame(1))
+    buffer.clear()
+
+    assert buffer.is_empty
+    assert buffer.to_array().size == 0
+    buffer.append(frame(5))
+    assert buffer.to_array().tolist() == [5] * 4
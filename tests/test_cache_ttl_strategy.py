@@ -0,0 +1,36 @@
+"""Tests for CacheTTLStrategy"""
+import pytest
+
+from src.infrastructure.adapters.ai.functionality.cache_ttl_strategy import CacheTTLStrategy
+
+
+@pytest.mark.parametrize("query, ttl", [
+    ("kolik je 2 + 3", float('inf')),
+    ("kolik je hodin", 30.0),
+    ("jaká je teplota venku", 1800.0),
+    ("co bylo včera", 300.0),
+    ("kdo napsal babičku", 3600.0),
+    ("Myslíš, že to zvládneme?", 1800.0),
+    ("ahoj", 0.0),
+])
+def test_get_ttl_categories(query, ttl):
+    assert CacheTTLStrategy.get_ttl(query) == ttl
+
+
+def test_get_ttl_is_case_insensitive():
+    assert CacheTTLStrategy.get_ttl("TEPLOTA venku") == 1800.0
+
+
+def test_get_ttl_uses_given_normalized_query():
+    assert CacheTTLStrategy.get_ttl("Weather", query_lower="weather") == 1800.0
+
+
+def test_keywords_match_as_literal_substrings():
+    # Víceslovné fráze se hledají doslova (včetně mezery)
+    assert CacheTTLStrategy.get_ttl("coje") == 0.0
+    assert CacheTTLStrategy.get_ttl("co je to") == 3600.0
+
+
+def test_should_cache():
+    assert CacheTTLStrategy.should_cache("kolik je hodin")
+    assert not CacheTTLStrategy.should_cache("ahoj")
@@ -0,0 +1,56 @@
+"""Tests for ContextBuilder quick answers"""
+import pytest
+from datetime import datetime
+
+# context_builder importuje LocationService (geolokace)
+pytest.importorskip("geocoder")
+pytest.importorskip("timezonefinder")
+pytest.importorskip("geopy")
+pytest.importorskip("requests")
+
+from src.application.services.context_builder import ContextBuilder
+from src.infrastructure.services.core.time_service import TimeService
+
+# Středa 5. 3. 2025 09:07
+FIXED_NOW = datetime(2025, 3, 5, 9, 7)
+
+
+class FakeUserConfig:
+    def get(self, key_path, default=None):
+        return default
+
+
+class FakeLocationService:
+    def get_current_location(self):
+        return {'city': 'Brno', 'country': 'Česko', 'timezone': 'Europe/Prague'}
+
+
+@pytest.fixture
+def builder(monkeypatch):
+    time_service = TimeService(timezone="Europe/Prague")
+    monkeypatch.setattr(time_service, "get_current_datetime", lambda: FIXED_NOW)
+    return ContextBuilder(
+        user_config=FakeUserConfig(),
+        time_service=time_service,
+        location_service=FakeLocationService()
+    )
+
+
+def test_quick_answer_time(builder):
+    assert builder.get_quick_time_answer("kolik je hodin") == "Je 09:07."
+
+
+def test_quick_answer_date(builder):
+    assert builder.get_quick_time_answer("jaké je datum") == "Dnes je 5. března 2025."
+
+
+def test_quick_answer_day(builder):
+    assert builder.get_quick_time_answer("jaký je den") == "Dnes je Středa."
+
+
+def test_quick_answer_location(builder):
+    assert builder.get_quick_time_answer("kde jsem") == "Jsi v Brno, Česko."
+
+
+def test_quick_answer_not_a_quick_query(builder):
+    assert builder.get_quick_time_answer("napiš mi básničku") is None
@@ -0,0 +1,49 @@
+"""Tests for IntelligentRouter keyword checks"""
+from structlog.testing import capture_logs
+
+from src.core.routing.intelligent_router import IntelligentRouter, RoutingDecision
+
+
+def test_sensitive_keyword_forces_local():
+    router = IntelligentRouter()
+
+    decision, metadata = router.route("jaké je moje heslo")
+
+    assert decision == RoutingDecision.FORCE_LOCAL
+    assert metadata['reason'] == 'sensitive_keyword_heslo'
+
+
+def test_sensitive_keyword_reason_uses_list_order():
+    router = IntelligentRouter()
+
+    # 'účet' je v textu dřív, ale 'heslo' je v SENSITIVE_WORDS první
+    decision, metadata = router.route("změň účet a heslo")
+
+    assert decision == RoutingDecision.FORCE_LOCAL
+    assert metadata['reason'] == 'sensitive_keyword_heslo'
+
+
+def test_no_sensitive_keyword():
+    router = IntelligentRouter()
+
+    decision, reason = router._phase1_privacy_check("zapni světlo v kuchyni")
+
+    assert decision is None
+    assert reason is None
+
+
+def test_placeholder_reason_uses_list_order():
+    router = IntelligentRouter()
+
+    with capture_logs() as logs:
+        # 'nemohu' je v odpovědi dřív, ale 'nevím' je v PLACEHOLDER_PHRASES první
+        escalate = router.should_escalate_to_cloud("Nemohu to zjistit, nevím.", "kolik je hodin")
+
+    assert escalate
+    assert [log['reason'] for log in logs if log['event'] == 'escalating_to_cloud'] == ['placeholder_nevím']
+
+
+def test_good_response_does_not_escalate():
+    router = IntelligentRouter()
+
+    assert not router.should_escalate_to_cloud("Je dvanáct hodin.", "kolik je hodin")
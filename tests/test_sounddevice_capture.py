@@ -0,0 +1,140 @@
+"""Tests for SoundDeviceCapture ring buffer"""
+import asyncio
+import pytest
+import numpy as np
+
+pytest.importorskip("sounddevice")
+
+from src.infrastructure.adapters.audio import sounddevice_capture
+from src.infrastructure.adapters.audio.sounddevice_capture import (
+    SoundDeviceCapture,
+    AUDIO_RING_SLOTS,
+)
+
+# SoundDeviceCapture vynucuje chunk 1280 (OpenWakeWord)
+CHUNK = 1280
+
+
+class FakeStream:
+    """RawInputStream bez zařízení - chunky posílá test přes _audio_callback"""
+
+    def __init__(self, **kwargs):
+        self.callback = kwargs['callback']
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class Status:
+    input_overflow = False
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    monkeypatch.setattr(sounddevice_capture.sd, "RawInputStream", FakeStream)
+    return SoundDeviceCapture(chunk_size=CHUNK, gain=1.0)
+
+
+def push(capture, value):
+    data = np.full(CHUNK, value, dtype=np.int16).tobytes()
+    capture._audio_callback(data, CHUNK, None, Status())
+
+
+def test_read_chunk_returns_chunks_in_order(capture):
+    async def run():
+        stream = capture.start_stream()
+        push(capture, 1)
+        push(capture, 2)
+        first = await capture.read_chunk(stream)
+        second = await capture.read_chunk(stream)
+        capture.stop_stream()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.tolist() == [1] * CHUNK
+    assert second.tolist() == [2] * CHUNK
+
+
+def test_full_ring_drops_oldest_chunks(capture):
+    async def run():
+        capture.start_stream()
+        for value in range(AUDIO_RING_SLOTS + 5):
+            push(capture, value)
+        chunks = capture.read_pending_chunks(AUDIO_RING_SLOTS * 2)
+        capture.stop_stream()
+        return chunks
+
+    chunks = asyncio.run(run())
+    # Zůstane AUDIO_RING_SLOTS - 1 nejnovějších chunků (slot pro další zápis je volný)
+    assert len(chunks) == AUDIO_RING_SLOTS - 1
+    assert [int(c[0]) for c in chunks] == list(range(6, AUDIO_RING_SLOTS + 5))
+
+
+def test_read_pending_chunks_into_out_buffer(capture):
+    async def run():
+        capture.start_stream()
+        for value in range(3):
+            push(capture, value)
+        out = np.empty(CHUNK * 2, dtype=np.int16)
+        chunks = capture.read_pending_chunks(10, out=out)
+        capture.stop_stream()
+        return out, chunks
+
+    out, chunks = asyncio.run(run())
+    assert len(chunks) == 2
+    assert out.tolist() == [0] * CHUNK + [1] * CHUNK
+
+
+def test_read_chunk_after_stop_raises(capture):
+    async def run():
+        stream = capture.start_stream()
+        waiting = asyncio.create_task(capture.read_chunk(stream))
+        await asyncio.sleep(0)
+        capture.stop_stream()
+        with pytest.raises(RuntimeError, match="not started"):
+            await asyncio.wait_for(waiting, timeout=1.0)
+        with pytest.raises(RuntimeError, match="not started"):
+            await capture.read_chunk(stream)
+
+    asyncio.run(run())
+
+
+def test_restart_does_not_return_stale_chunks(capture):
+    async def run():
+        stream = capture.start_stream()
+        push(capture, 7)
+        capture.stop_stream()
+
+        stream = capture.start_stream()
+        assert capture.read_pending_chunks(10) == []
+        push(capture, 3)
+        chunk = await capture.read_chunk(stream)
+        capture.stop_stream()
+        return chunk
+
+    assert asyncio.run(run()).tolist() == [3] * CHUNK
+
+
+def test_start_stream_without_running_loop_raises(capture):
+    with pytest.raises(RuntimeError, match="running event loop"):
+        capture.start_stream()
+    assert capture.stream is None
+
+
+def test_start_stream_with_explicit_loop(capture):
+    loop = asyncio.new_event_loop()
+    try:
+        stream = capture.start_stream(loop=loop)
+        push(capture, 4)
+        chunk = loop.run_until_complete(capture.read_chunk(stream))
+        capture.stop_stream()
+    finally:
+        loop.close()
+
+    assert chunk.tolist() == [4] * CHUNK
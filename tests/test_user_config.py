@@ -0,0 +1,78 @@
+"""Tests for UserConfig"""
+import os
+import pytest
+
+from src.core.config.user_config import UserConfig
+
+CONFIG = """
+user:
+  name: Tester
+  language: cs
+audio:
+  sample_rate: 16000
+  vad:
+    quick_silence: 0.3
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "user_config.yaml"
+    path.write_text(CONFIG, encoding="utf-8")
+    return path
+
+
+def rewrite(path, text):
+    """Přepiš soubor a posuň mtime, aby se změna poznala i na hrubých FS"""
+    stat = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_get_dotted_paths(config_file):
+    config = UserConfig(str(config_file))
+
+    assert config.get('user.name') == 'Tester'
+    assert config.get('audio.sample_rate', 44100) == 16000
+    assert config.get('audio.vad.quick_silence', 1.0) == 0.3
+    # Mezilehlé sekce jsou v indexu jako dict
+    assert config.get('audio.vad', {}) == {'quick_silence': 0.3}
+    assert config.get('missing.key', 'fallback') == 'fallback'
+
+
+def test_get_type_mismatch_returns_default(config_file):
+    config = UserConfig(str(config_file))
+
+    assert config.get('audio.sample_rate', 'x') == 'x'
+
+
+def test_reload_skips_unchanged_file(config_file):
+    config = UserConfig(str(config_file))
+    calls = []
+    config.on_reload(lambda: calls.append(1))
+
+    config.reload()
+
+    assert calls == []
+
+
+def test_reload_picks_up_changes_and_notifies(config_file):
+    config = UserConfig(str(config_file))
+    calls = []
+    config.on_reload(lambda: calls.append(1))
+
+    rewrite(config_file, CONFIG.replace("Tester", "Changed"))
+    config.reload()
+
+    assert calls == [1]
+    assert config.get('user.name') == 'Changed'
+
+
+def test_forced_reload_runs_callbacks(config_file):
+    config = UserConfig(str(config_file))
+    calls = []
+    config.on_reload(lambda: calls.append(1))
+
+    config.reload(force=True)
+
+    assert calls == [1]